@@ -1,10 +1,14 @@
 from .driver import Driver
 from .controller import Controller
 from .config import Config
+from .pool import BrowserPool
+from .locator import Locator
 
 
 __all__ = [
     'Driver',
     'Controller',
-    'Config'
+    'Config',
+    'BrowserPool',
+    'Locator'
 ]
@@ -1,12 +1,22 @@
-import os
 import logging
+import time
+from pathlib import Path
 
 
 class Config:
 
-    BASE_DIR = os.getcwd()
-    LOG_DIR = os.path.join(BASE_DIR, 'logs')
-    SCREENSHOT_DIR = os.path.join(BASE_DIR, 'screenshots')
+    BASE_DIR = Path.cwd()
+    LOG_DIR = BASE_DIR / 'logs'
+    SCREENSHOT_DIR = BASE_DIR / 'screenshots'
 
     DRIVER_PATH = None
     LOG_LEVEL = logging.INFO
+
+    _log_file_path: Path | None = None
+
+    @classmethod
+    def log_file_path(cls) -> Path:
+        """Caminho padrão do arquivo de log. O horário do nome é definido no primeiro acesso."""
+        if cls._log_file_path is None:
+            cls._log_file_path = cls.LOG_DIR / f'{time.strftime("%d-%m-%Y_%H-%M")}.log'
+        return cls._log_file_path
@@ -1,80 +1,153 @@
-from contextlib import contextmanager
+from contextvars import ContextVar
 from time import sleep
-from typing import Callable, Hashable, Generator
+from types import MethodType
+from typing import Callable, Hashable, Mapping
 from .types import P, T
 
 
-_execution_controller: dict[Hashable, bool] = {}
+# Instâncias (por id) com uma chamada controlada em andamento no contexto atual.
+# Por ser uma ContextVar, cada thread e cada task assíncrona tem o seu próprio estado,
+# e nenhuma referência às instâncias é mantida após o fim da chamada.
+_executing: ContextVar[frozenset[int]] = ContextVar('_executing', default=frozenset())
+
+ExceptionHandler = Callable[[object, Exception], None]
+
+
+def _build_handler_table(
+    handlers: Mapping[type[Exception], ExceptionHandler]
+) -> tuple[tuple[type[Exception], ExceptionHandler], ...]:
+    # Da exceção mais específica para a mais genérica, pela profundidade do __mro__
+    return tuple(sorted(handlers.items(), key=lambda item: len(item[0].__mro__), reverse=True))
+
 
 class _ControllerWrapper:
 
+    __slots__ = (
+        '_controller', '_func', '_retries', '_retry_delay',
+        '_exception_handler', '_handler_table', '_handler_cache'
+    )
+
     def __init__(
         self,
         controller: 'Controller',
         func: Callable[P, T],
-        exception_handler: Callable[[object, Exception], None] | None = None,
+        exception_handler: ExceptionHandler | Mapping[type[Exception], ExceptionHandler] | None = None,
         retries: int = 0,
         retry_delay: float = 0.0,
     ) -> None:
         
         self._controller = controller
         self._func = func
+        # Sem valor próprio (0), as tentativas usam os valores do controller no momento do erro,
+        # para que alterações em 'controller.retries' e 'controller.retry_delay' continuem valendo
         self._retries = retries
         self._retry_delay = retry_delay
-        self._instance = None
         self._exception_handler = exception_handler if exception_handler is not None else controller.exception_handler
+
+        # Tabela pré-computada para tratadores por tipo de exceção
+        self._handler_table = None
+        self._handler_cache: dict[type[Exception], ExceptionHandler | None] = {}
+        if isinstance(self._exception_handler, Mapping):
+            self._handler_table = _build_handler_table(self._exception_handler)
+
+    def _resolve_handler(self, exc_type: type[Exception]) -> ExceptionHandler | None:
+
+        if self._handler_table is None:
+            return self._exception_handler
+
+        # Ocorrências seguintes do mesmo tipo custam uma única consulta
+        try:
+            return self._handler_cache[exc_type]
+        except KeyError:
+            pass
+
+        handler = None
+        for t, h in self._handler_table:
+            if issubclass(exc_type, t):
+                handler = h
+                break
+        self._handler_cache[exc_type] = handler
+        return handler
     
-    def handle_error(self, exception: Exception) -> None:
+    def handle_error(self, exception: Exception, instance: Hashable | None = None) -> None:
 
-        if not self._exception_handler:
+        handler = self._resolve_handler(type(exception))
+        if not handler:
             raise exception
         
-        args = (self._instance, exception) if self._instance is not None else (exception,)
-        return self._exception_handler(*args)
+        args = (instance, exception) if instance is not None else (exception,)
+        return handler(*args)
         
 
-    @contextmanager
-    def _execution_context(self, instance) -> Generator[None, None, None]:
+    def _execute_handled(self, instance: Hashable, *args: P.args, **kwargs: P.kwargs) -> T:
 
-        _execution_controller[instance] = True
+        # O contexto é montado uma única vez, fora do laço de tentativas
+        token = _executing.set(_executing.get() | {id(instance)})
         try:
-            yield
+            return self._execute(*args, **kwargs)
         except Exception as e:
-            return self.handle_error(e)
+            return self.handle_error(e, instance)
         finally:
-            _execution_controller[instance] = False
-            self._instance = None
+            _executing.reset(token)
     
     def _execute(self, *args: P.args, **kwargs: P.kwargs) -> T:
 
-        for i in range(self._controller.retries+1):
+        # Caminho sem erros: apenas a chamada da função
+        try:
+            return self._func(*args, **kwargs)
+        except Exception:
+            retries = self._retries or self._controller.retries
+            if not retries:
+                raise
+        return self._retry(retries, self._retry_delay or self._controller.retry_delay, *args, **kwargs)
+
+    def _retry(self, retries: int, retry_delay: float, *args: P.args, **kwargs: P.kwargs) -> T:
+
+        attempts = 1
+        while True:
+            sleep(retry_delay)
+            attempts += 1
             try:
                 return self._func(*args, **kwargs)
-            except Exception as e:
-                if i == self._controller.retries:
-                    raise e
-                sleep(self._controller.retry_delay)
+            except Exception:
+                if attempts > retries:
+                    raise
+
+    def __get__(self, instance: Hashable | None, owner: type) -> Callable:
+        if instance is None:
+            return self
 
-    def __get__(self, instance: Hashable, owner: type) -> Callable:
-        self._instance = instance
-        return self
+        # A instância é ligada ao método retornado, e não guardada no wrapper compartilhado
+        return MethodType(self._call_bound, instance)
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        return self._execute_handled(None, *args, **kwargs)
 
-        if self._instance is not None:
-            args = (self._instance, *args)
-            if _execution_controller.get(self._instance, False):
-                return self._func(*args, **kwargs)
+    def _call_bound(self, instance: Hashable, *args: P.args, **kwargs: P.kwargs) -> T:
 
-        with self._execution_context(self._instance):
-            return self._execute(*args, **kwargs)
+        # Caminho rápido: chamada aninhada, o erro será tratado pela chamada externa
+        executing = _executing.get()
+        if id(instance) in executing:
+            return self._func(instance, *args, **kwargs)
+
+        # Sem tratador de exceções, não há o que fazer no erro além de propagá-lo
+        if self._exception_handler is None:
+            token = _executing.set(executing | {id(instance)})
+            try:
+                return self._execute(instance, *args, **kwargs)
+            finally:
+                _executing.reset(token)
+
+        return self._execute_handled(instance, instance, *args, **kwargs)
 
 
 class Controller:
 
+    __slots__ = ('exception_handler', 'retries', 'retry_delay')
+
     def __init__(
         self,
-        exception_handler: Callable[[object, Exception], None] | None = None,
+        exception_handler: ExceptionHandler | Mapping[type[Exception], ExceptionHandler] | None = None,
         retries: int = 0,
         retry_delay: float = 0.0,
     ) -> None:
@@ -86,7 +159,7 @@ class Controller:
     def on_error(
         self,
         func: Callable[P, T] | None = None,
-        exception_handler: Callable[[object, Exception], None] | None = None,
+        exception_handler: ExceptionHandler | Mapping[type[Exception], ExceptionHandler] | None = None,
         retries: int = 0,
         retry_delay: float = 0.0
     ) -> Callable[P, T]:
@@ -1,26 +1,310 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver import Chrome
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.chromium.options import ChromiumOptions
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSessionIdException,
+    NoSuchWindowException
+)
 from selenium.types import WaitExcTypes
+import atexit
+import base64
+import copy
+import itertools
 import logging
-from datetime import datetime
 import os
-from typing import Callable, Self, Any
-from .wait import Wait
+import shutil
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Self, Any, Mapping, Generator, TYPE_CHECKING
+from .wait import Wait, MAX_POLL_FREQUENCY
 from .controller import Controller
 from .config import Config
 from .log import LogManager
-from .utils import is_web_element, describe_element
+from .pool import BrowserPool
+from .locator import Locator
+from .utils import is_web_element, locator_kind, LazyDescription, WEB_ELEMENT, BY_TUPLE
 from .types import P, T
 
+if TYPE_CHECKING:
+    from selenium.webdriver.support.ui import Select
+
 controller = Controller()
 
+# Condições usadas diretamente pelo Driver, resolvidas uma única vez
+_EC_PRESENCE = EC.presence_of_element_located
+_EC_ALL_OF = EC.all_of
+_EC_ANY_OF = EC.any_of
+
+# Timeouts até este valor procuram o elemento diretamente, sem WebDriverWait
+_FAST_FIND_MAX_TIMEOUT = 1
+_FAST_FIND_INTERVAL = 0.05
+
+# Nomes de screenshot: horário de início da sessão e um contador compartilhado entre os drivers,
+# garantindo nomes únicos mesmo com vários erros no mesmo segundo
+_SESSION_TIMESTAMP = time.strftime('%Y%m%d_%H%M%S')
+_screenshot_counter = itertools.count(1)
+
+# Intervalo entre tentativas de clique em um elemento ainda não clicável
+_CLICK_RETRY_INTERVAL = 0.1
+
+# Intervalo entre as verificações de que o navegador reaproveitável já aceita conexões
+_BROWSER_READY_INTERVAL = 0.1
+
+# Chave W3C que identifica um WebElement nos comandos enviados ao navegador
+_W3C_ELEMENT_KEY = 'element-6066-11e4-a52e-4f735466cecf'
+
+# Preferências do Chrome para 'fast_mode': imagens e folhas de estilo não são carregadas
+_FAST_MODE_PREFS = {
+    'profile.managed_default_content_settings.images': 2,
+    'profile.managed_default_content_settings.stylesheets': 2,
+}
+
+# Quantidade máxima de elementos no cache; os menos usados recentemente são descartados
+_ELEMENT_CACHE_MAXSIZE = 128
+
+# Localiza vários elementos em uma única chamada. Retorna undefined para estratégias não suportadas
+_JS_FIND_MANY = """
+const find = ([by, value]) => {
+    switch (by) {
+        case 'css selector': return document.querySelector(value);
+        case 'id': return document.getElementById(value);
+        case 'name': return document.getElementsByName(value)[0] || null;
+        case 'class name': return document.getElementsByClassName(value)[0] || null;
+        case 'tag name': return document.getElementsByTagName(value)[0] || null;
+        case 'xpath': return document.evaluate(
+            value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return undefined;
+};
+return arguments[0].map(find);
+"""
+
+# Localiza todos os elementos de um seletor. Retorna null para estratégias não suportadas
+_JS_FIND_ALL = """
+const findAll = (by, value) => {
+    switch (by) {
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'id': return Array.from(document.querySelectorAll(`[id="${CSS.escape(value)}"]`));
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'xpath': {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+    }
+    return null;
+};
+const elements = findAll(arguments[0], arguments[1]);
+if (elements === null) return null;
+"""
+
+_JS_FIND_VISIBLE = _JS_FIND_ALL + """
+return elements.filter(e => { const r = e.getBoundingClientRect(); return r.width > 0 && r.height > 0; });
+"""
+
+# Corpo de 'map_elements', executado para cada elemento com 'element', 'index' e 'args' disponíveis
+_JS_MAP_BODY = "return elements.map((element, index) => {\n%s\n});"
+_JS_MAP_ELEMENTS = _JS_FIND_ALL + "const args = Array.prototype.slice.call(arguments, 2);\n" + _JS_MAP_BODY
+_JS_MAP_GIVEN = "const elements = arguments[0];\nconst args = Array.prototype.slice.call(arguments, 1);\n" + _JS_MAP_BODY
+
+# Corpos usados por 'get_texts', 'are_enabled' e 'are_displayed'
+_JS_TEXT = "return args[0] ? element.textContent : element.innerText;"
+_JS_ENABLED = "return !element.disabled;"
+_JS_DISPLAYED = "return !!(element.offsetWidth || element.offsetHeight || element.getClientRects().length);"
+
+# Aguarda, no próprio navegador, o elemento do seletor CSS estar visível e habilitado.
+# Retorna o elemento, ou null caso o tempo (em ms) se esgote. Usa setTimeout, e não
+# requestAnimationFrame, que é suspenso em abas em segundo plano
+_JS_POLL_CLICKABLE = """
+const [selector, timeout, interval, done] = arguments;
+const start = Date.now();
+const tick = () => {
+    const element = document.querySelector(selector);
+    if (element && !element.disabled && element.getClientRects().length > 0) {
+        done(element);
+    } else if (Date.now() - start > timeout) {
+        done(null);
+    } else {
+        setTimeout(tick, interval);
+    }
+};
+tick();
+"""
+
+# Intervalo, em ms, entre as verificações de '_JS_POLL_CLICKABLE'
+_POLL_CLICKABLE_INTERVAL_MS = 50
+
+# Folga entre a espera no navegador e o tempo limite de scripts da sessão, para que ele não se esgote antes
+_SCRIPT_TIMEOUT_MARGIN = 1
+
+_JS_HOVER = """
+const element = arguments[0];
+element.dispatchEvent(new MouseEvent('mouseover', {bubbles: true}));
+element.dispatchEvent(new MouseEvent('mouseenter', {bubbles: false}));
+"""
+
+# Rola até o elemento e informa, no mesmo retorno, se ele ficou visível e não está coberto
+_JS_SCROLL_AND_CHECK = """
+const element = arguments[0];
+element.scrollIntoView(true);
+const r = element.getBoundingClientRect();
+const inViewport = r.width > 0 && r.height > 0 && r.top >= 0 && r.bottom <= window.innerHeight;
+const top = inViewport ? document.elementFromPoint(r.x + r.width / 2, r.y + r.height / 2) : null;
+return {visible: inViewport && top !== null && element.contains(top), x: r.x, y: r.y};
+"""
+
+_JS_SCROLL_AND_CLICK = "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();"
+
+_JS_SCROLL_AND_GET_TEXT = "arguments[0].scrollIntoView({block: 'center'}); return arguments[0].innerText;"
+
+_JS_SCROLL_AND_SET_VALUE = """
+const element = arguments[0];
+element.scrollIntoView({block: 'center'});
+element.focus();
+element.value = arguments[1];
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+_JS_SET_VALUE = """
+const element = arguments[0];
+element.value = arguments[1];
+element.dispatchEvent(new Event('input', {bubbles: true}));
+element.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+_JS_SCROLL_TO_ELEMENT = "arguments[0].scrollIntoView(true);"
+
+# Localiza o elemento do seletor CSS e rola até ele na mesma chamada. Retorna null se não existir.
+_JS_SCROLL_TO_SELECTOR = """
+const element = document.querySelector(arguments[0]);
+if (element) element.scrollIntoView(true);
+return element;
+"""
+_JS_SCROLL_BOTTOM = "window.scrollTo(0, document.body.scrollHeight);"
+_JS_SCROLL_TOP = "window.scrollTo(0, 0);"
+
+
+def _evict_stale(func: Callable[P, T]) -> Callable[P, T]:
+    """
+    Caso o elemento em cache do locator tenha expirado, remove-o do cache
+    e executa o método novamente, localizando o elemento outra vez.
+    """
+
+    @wraps(func)
+    def wrapper(self: 'Driver', locator, *args, **kwargs):
+        try:
+            return func(self, locator, *args, **kwargs)
+        except StaleElementReferenceException:
+            if is_web_element(locator) or self._element_cache.pop(locator, None) is None:
+                raise
+            return func(self, locator, *args, **kwargs)
+
+    return wrapper
+
+
+class _PersistentService(Service):
+    """
+    Serviço do chromedriver que continua ativo quando o navegador é fechado. Assim, apenas o
+    navegador é reiniciado a cada 'init', sem um novo processo do chromedriver.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+
+    def start(self) -> None:
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is not None and process.poll() is None:
+                return
+            super().start()
+
+    def stop(self) -> None:
+        # Chamado pelo 'quit' do driver: o chromedriver é encerrado apenas em 'shutdown'
+        pass
+
+    def shutdown(self) -> None:
+        """Encerra o processo do chromedriver, caso tenha sido iniciado."""
+        if getattr(self, 'process', None) is not None:
+            super().stop()
+
+
+_shared_service: _PersistentService | None = None
+_shared_service_lock = threading.Lock()
+
+
+def _get_shared_service() -> _PersistentService:
+    """Retorna o serviço do chromedriver compartilhado entre os drivers, criando-o na primeira chamada."""
+
+    global _shared_service
+    with _shared_service_lock:
+        if _shared_service is None:
+            _shared_service = _PersistentService()
+            atexit.register(_shared_service.shutdown)
+        return _shared_service
+
+
 class Driver:
 
+    __slots__ = (
+        '_options',
+        '_service',
+        '_keep_alive',
+        '_driver_cls',
+        '_default_timeout',
+        '_default_poll_frequency',
+        '_default_ignored_exceptions',
+        '_pool',
+        '_pool_maxsize',
+        '_strict_explicit_waits',
+        '_heartbeat_interval',
+        '_page_load_strategy',
+        '_reuse_service',
+        '_fast_mode',
+        '_log_level',
+        '_log_file_path',
+        '_reuse_browser',
+        '_browser_process',
+        '_browser_profile_dir',
+        '_debugger_address',
+        '_heartbeat_thread',
+        '_heartbeat_stop',
+        '_implicit_timeout',
+        '_script_timeout',
+        '_js_batch',
+        '_actions',
+        'log',
+        'save_screenshot_on_error',
+        '_driver',
+        '_wait',
+        '_element_cache',
+        '_select_cache',
+        '_cache_depth',
+        '_io_pool',
+        '_screenshot_dir',
+        '__weakref__'
+    )
+
     def __init__(
         self,
         options: Options | None = None,
@@ -29,16 +313,27 @@ class Driver:
         driver_cls: type[WebDriver] = Chrome,
         save_screenshot_on_error: bool = True,
         default_timeout: float = 30,
-        default_poll_frequency: float = 0.5,
+        default_poll_frequency: float = 0.1,
         default_ignored_exceptions: WaitExcTypes | None = None,
         logger: logging.Logger | None = None,
         log_level: int | None = None,
         log_file_path: str | None = None,
-        log_indent: int | None = None
+        log_indent: int | None = None,
+        pool: BrowserPool | None = None,
+        pool_maxsize: int = 10,
+        strict_explicit_waits: bool = True,
+        heartbeat_interval: float | None = None,
+        page_load_strategy: str | None = 'eager',
+        reuse_service: bool = False,
+        fast_mode: bool = False,
+        reuse_browser: bool = False
     ) -> None:
         """
         Gerenciador de driver do Selenium.
 
+        Todas as esperas são explícitas. Por isso, a espera implícita do WebDriver é zerada ao
+        iniciar o driver e não deve ser reativada, pois somaria o seu tempo a cada espera explícita.
+
         Args:
             options: Opções Selenium do Driver.
             service: Serviço Selenium do Driver.
@@ -46,10 +341,51 @@ class Driver:
             driver_cls: Classe do driver a ser usada.
             save_screenshot_on_error: Se deve salvar screenshot em caso de erro.
             default_timeout: Tempo padrão de espera para condições.
-            default_poll_frequency: Frequência padrão de polling para condições.
+            default_poll_frequency: Frequência padrão de polling para condições. Um intervalo curto
+                devolve o elemento logo após ele aparecer, em vez de até meio segundo depois.
+                É o intervalo inicial: ele dobra a cada tentativa, até meio segundo, para que
+                esperas longas não enviem comandos ao navegador sem necessidade.
             default_ignored_exceptions: Exceções a serem ignoradas durante as esperas.
             logger: Logger para registrar eventos. Se não for passado um, criará um logger padrão.
+            pool: Pool de drivers pré-aquecidos. Se informado, o driver é retirado do pool
+                em vez de ser criado, e devolvido a ele ao fechar.
+            pool_maxsize: Quantidade máxima de conexões HTTP simultâneas com o navegador.
+            strict_explicit_waits: Se deve zerar a espera implícita do WebDriver ao iniciá-lo.
+            heartbeat_interval: Intervalo, em segundos, de um comando leve enviado em segundo plano
+                para manter aberta a conexão com o navegador enquanto o bot está ocioso.
+                Desativado por padrão.
+            page_load_strategy: Estratégia de carregamento de página ('normal', 'eager' ou 'none').
+                Com 'eager', 'get' retorna assim que o DOM é carregado, sem aguardar imagens e
+                outros recursos. Usada apenas quando 'options' não é informado e o driver é o Chrome.
+            reuse_service: Se deve reaproveitar um único chromedriver, compartilhado entre os drivers,
+                em vez de iniciar um novo a cada 'init'. O chromedriver é encerrado ao fim do processo.
+                Usado apenas quando 'service' não é informado e o driver é o Chrome.
+            fast_mode: Se deve desativar o carregamento de imagens e folhas de estilo, para que as
+                páginas carreguem mais rápido. Indicado para extração de dados, já que o layout muda.
+                Usado apenas com o Chrome; as preferências são adicionadas a 'options', se informado.
+            reuse_browser: Se deve manter o mesmo navegador aberto entre 'quit' e 'init'. O Chrome é
+                iniciado uma única vez, com depuração remota, e cada 'init' apenas se conecta a ele.
+                Use 'shutdown', ou saia do bloco 'with', para fechá-lo e remover o seu perfil temporário.
+                Apenas as opções de linha de comando são usadas.
         """
+
+        # As opções do Chrome só servem ao Chrome: outros drivers mantêm a estratégia padrão
+        is_chrome = isinstance(driver_cls, type) and issubclass(driver_cls, Chrome)
+        if options is None and is_chrome and (page_load_strategy is not None or fast_mode):
+            options = Options()
+            if page_load_strategy is not None:
+                options.page_load_strategy = page_load_strategy
+
+        if fast_mode and isinstance(options, ChromiumOptions):
+            # As opções recebidas são copiadas: reaproveitá-las em outro driver não deve herdar o modo rápido
+            options = copy.deepcopy(options)
+
+            # Preferências já definidas pelo usuário têm prioridade
+            prefs = options.experimental_options.get('prefs', {})
+            options.add_experimental_option('prefs', {**_FAST_MODE_PREFS, **prefs})
+
+        if service is None and reuse_service and is_chrome:
+            service = _get_shared_service()
         
         self._options = options
         self._service = service
@@ -58,6 +394,22 @@ class Driver:
         self._default_timeout = default_timeout
         self._default_poll_frequency = default_poll_frequency
         self._default_ignored_exceptions = default_ignored_exceptions
+        self._pool = pool
+        self._pool_maxsize = pool_maxsize
+        self._strict_explicit_waits = strict_explicit_waits
+        self._heartbeat_interval = heartbeat_interval
+        self._page_load_strategy = page_load_strategy
+        self._reuse_service = reuse_service
+        self._fast_mode = fast_mode
+        self._log_level = log_level
+        self._log_file_path = log_file_path
+        self._reuse_browser = reuse_browser
+        self._browser_process: subprocess.Popen | None = None
+        self._browser_profile_dir: str | None = None
+        self._debugger_address: str | None = None
+        self._heartbeat_thread: threading.Thread | None = None
+        self._heartbeat_stop = threading.Event()
+        self.save_screenshot_on_error = save_screenshot_on_error
         self.log = LogManager(
             logger=logger,
             log_level=log_level,
@@ -67,6 +419,15 @@ class Driver:
 
         self._driver = None
         self._wait = None
+        self._implicit_timeout: float | None = None
+        self._script_timeout: float | None = None
+        self._js_batch: list[tuple[str, tuple]] | None = None
+        self._actions = None
+        self._element_cache: OrderedDict[tuple[str, str], WebElement] = OrderedDict()
+        self._cache_depth = 0
+        self._select_cache: dict[str, 'Select'] = {}
+        self._io_pool: ThreadPoolExecutor | None = None
+        self._screenshot_dir = os.fspath(Config.SCREENSHOT_DIR)
 
         if save_screenshot_on_error:
             controller.exception_handler = self.save_screenshot
@@ -97,24 +458,54 @@ class Driver:
         self.log.info("Iniciando driver")
         self.quit()
         self._driver = self._start_driver()
+        self._check_keep_alive()
+
+    def _check_keep_alive(self) -> None:
+        """
+        Verifica se a conexão com o navegador está sendo reaproveitada e, para drivers vindos
+        do pool, que podem ter ficado ociosos, envia um comando leve para reabrir a conexão
+        antes do primeiro comando do usuário. Drivers novos já abriram a conexão ao criar a sessão.
+        """
+
+        if self._keep_alive and getattr(self._driver.command_executor, '_conn', None) is None:
+            self.log.warning("keep_alive ativo, mas a conexão com o navegador não está sendo reaproveitada")
+
+        if self._pool is not None:
+            from selenium.webdriver.remote.command import Command  # Importado sob demanda
+            self._driver.execute(Command.GET_TITLE)
     
     def quit(self) -> None:
-        """Fecha o driver e libera os recursos. Caso não esteja inicializado, não faz nada."""
-        
-        if self._driver is None:
-            return
-        
-        self.log.info("Fechando driver")
-        self._driver.quit()
-        self._driver = None
-        self._wait = None  # Limpa a instância do wait também
+        """
+        Fecha o driver e libera os recursos. Caso não esteja inicializado, não faz nada.
+        Se o driver veio de um pool, ele é devolvido ao pool em vez de ser encerrado.
+        Com 'reuse_browser', apenas desconecta do navegador, que continua aberto.
+        """
+        self._release_driver(healthy=True)
+
+    def shutdown(self) -> None:
+        """Fecha o driver e também o navegador mantido aberto por 'reuse_browser'."""
+
+        self.quit()
+        self._shutdown_browser()
 
     @controller.on_error
-    def get(self, url: str) -> None:
-        """Navega para a URL especificada."""
-        self.log.info(f"Acessando URL: {url}")
+    def get(self, url: str, wait_selector: str | None = None) -> None:
+        """
+        Navega para a URL especificada.
+
+        Args:
+            url: A URL a ser acessada.
+            wait_selector: Seletor CSS de um elemento a ser aguardado após a navegação. Útil com
+                page_load_strategy 'eager' ou 'none', para aguardar apenas o que a página precisa.
+        """
+        self.log.info("Acessando URL: %s", url)
+        self.invalidate_cache()
         self.driver.get(url)
 
+        if wait_selector is not None:
+            self.log.info('Aguardando elemento (css selector="%s")', wait_selector)
+            self._find_element_now('css selector', wait_selector, self._default_timeout, self._default_poll_frequency, backoff=True)
+
     @controller.on_error
     def find_element(
         self,
@@ -122,7 +513,8 @@ class Driver:
         value: str,
         timeout: float | None = None,
         poll_frequency: float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        cache: bool = False
     ) -> WebElement:
         """
         Encontra um único elemento na página.
@@ -133,14 +525,38 @@ class Driver:
             timeout: Tempo máximo para aguardar o elemento.
             poll_frequency: Frequência de polling para verificar a presença do elemento.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
+            cache: Se deve reaproveitar o elemento de uma busca anterior pelo mesmo seletor,
+                guardando-o no cache caso ainda não esteja. Veja 'cached'.
+
+        Sem poll_frequency e ignored_exceptions, nem exceções ignoradas por padrão, a busca não usa
+        WebDriverWait: com timeout de até 1 segundo, o elemento é procurado diretamente em intervalos
+        de 50ms, pois espera-se que ele já esteja na página; com timeouts maiores, a espera é feita
+        pelo próprio navegador (espera implícita), sem uma requisição por tentativa.
+        Caso contrário, é usada a espera padrão, que respeita esses parâmetros.
         """
-        self.log.info(f'Procurando elemento ({by}="{value}")')
-        return self.wait.presence_of_element_located(
-            locator=(by, value),
-            timeout=timeout,
-            poll_frequency=poll_frequency,
-            ignored_exceptions=ignored_exceptions
-        )
+        locator = (by, value)
+        if cache:
+            element = self._from_cache(locator)
+            if element is not locator:
+                return element
+
+        self.log.info('Procurando elemento (%s="%s")', by, value)
+        direct = poll_frequency is None and ignored_exceptions is None and self._default_ignored_exceptions is None
+        if direct and timeout is not None and timeout <= _FAST_FIND_MAX_TIMEOUT:
+            element = self._find_element_now(by, value, timeout)
+        elif direct and self._strict_explicit_waits:
+            element = self._find_element_implicit(by, value, timeout)
+        else:
+            element = self.wait.presence_of_element_located(
+                locator=locator,
+                timeout=timeout,
+                poll_frequency=poll_frequency,
+                ignored_exceptions=ignored_exceptions
+            )
+
+        if cache:
+            self._cache_element(locator, element)
+        return element
 
     @controller.on_error
     def find_elements(
@@ -161,7 +577,7 @@ class Driver:
             poll_frequency: Frequência de polling para verificar a presença dos elementos.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
-        self.log.info(f"Procurando elementos por {by}='{value}'")
+        self.log.info("Procurando elementos por %s='%s'", by, value)
         return self.wait.presence_of_all_elements_located(
             locator=(by, value),
             timeout=timeout,
@@ -169,7 +585,167 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
+    def quick_find(self, by: str, value: str) -> WebElement:
+        """
+        Procura o elemento diretamente no driver, sem espera, log ou tratamento de erros.
+        Para laços críticos em que já se sabe que o elemento está na página.
+
+        Args:
+            by: O método de localização.
+            value: O valor do seletor.
+        """
+        return self.driver.find_element(by, value)
+
+    def quick_find_all(self, by: str, value: str) -> list[WebElement]:
+        """
+        Procura os elementos diretamente no driver, sem espera, log ou tratamento de erros.
+        Para laços críticos em que já se sabe que os elementos estão na página.
+
+        Args:
+            by: O método de localização.
+            value: O valor do seletor.
+        """
+        return self.driver.find_elements(by, value)
+
+    @controller.on_error
+    def find_many(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> list[WebElement]:
+        """
+        Encontra um elemento para cada locator, todos em uma única chamada ao navegador.
+        Os elementos encontrados ficam no cache usado por 'cached'. Locators sem resultado
+        imediato (ou com estratégias como 'link text') são procurados individualmente, com espera.
+
+        Args:
+            locators: Lista de tuplas (by, value) dos seletores.
+            timeout: Tempo máximo para aguardar os elementos não encontrados de imediato.
+            poll_frequency: Frequência de polling para verificar a presença dos elementos.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        self.log.info("Procurando %s elementos em lote", len(locators))
+        found = self.driver.execute_script(_JS_FIND_MANY, [list(locator) for locator in locators])
+
+        elements = []
+        for locator, element in zip(locators, found):
+            if element is None:
+                element = self.find_element(
+                    *locator,
+                    timeout=timeout,
+                    poll_frequency=poll_frequency,
+                    ignored_exceptions=ignored_exceptions
+                )
+            self._cache_element(tuple(locator), element)
+            elements.append(element)
+        return elements
+
     @controller.on_error
+    def find_elements_multi(self, locators: list[tuple[str, str]], timeout: float | None = None) -> list[WebElement]:
+        """
+        Encontra um elemento para cada locator, com as buscas enviadas em paralelo por threads
+        que compartilham o pool de conexões HTTP (veja 'pool_maxsize').
+
+        O navegador executa os comandos de uma sessão um de cada vez: o ganho vem de sobrepor a
+        preparação e o envio das requisições. Para elementos que já estão na página, 'find_many'
+        costuma ser mais rápido, pois faz todas as buscas em uma única chamada.
+
+        Args:
+            locators: Lista de tuplas (by, value) dos seletores.
+            timeout: Tempo máximo para aguardar cada elemento.
+        """
+
+        if not locators:
+            return []
+
+        self.log.info("Procurando %s elementos em paralelo", len(locators))
+        timeout = timeout if timeout is not None else self._default_timeout
+        self.driver  # Inicia o driver, se necessário, antes das threads, para que não seja iniciado em paralelo
+
+        def find(locator: tuple[str, str]) -> WebElement:
+            # Busca direta no driver: a espera implícita é um estado da sessão e não pode ser alternada em paralelo
+            return self._find_element_now(*locator, timeout, self._default_poll_frequency, backoff=True)
+
+        with ThreadPoolExecutor(max_workers=min(len(locators), self._pool_maxsize), thread_name_prefix='drv-find') as executor:
+            return list(executor.map(find, locators))
+
+    def find_visible_elements(self, by: str, value: str) -> list[WebElement]:
+        """
+        Retorna os elementos visíveis (com largura e altura) do seletor, filtrados no próprio
+        navegador em uma única chamada, em vez de um 'is_displayed' por elemento.
+        Não aguarda os elementos: retorna o estado atual da página.
+
+        Args:
+            by: O método de localização.
+            value: O valor do seletor.
+        """
+        self.log.info("Procurando elementos visíveis por %s='%s'", by, value)
+        elements = self.driver.execute_script(_JS_FIND_VISIBLE, by, value)
+        if elements is None:
+            return [element for element in self.driver.find_elements(by, value) if element.is_displayed()]
+        return elements
+
+    def get_texts(
+        self,
+        by: str | list[WebElement],
+        value: str | None = None,
+        text_content: bool = False
+    ) -> list[str]:
+        """
+        Retorna o texto de todos os elementos do seletor em uma única chamada ao navegador.
+        Não aguarda os elementos: retorna o estado atual da página.
+
+        Args:
+            by: O método de localização, ou uma lista de WebElements já encontrados.
+            value: O valor do seletor. Não usado com uma lista de WebElements.
+            text_content: Se deve usar 'textContent' em vez de 'innerText'. É mais rápido, pois não
+                calcula o layout da página, mas inclui texto oculto e não normaliza os espaços.
+        """
+        return self._map_elements("Obtendo textos", by, value, _JS_TEXT, text_content)
+
+    def are_enabled(self, by: str | list[WebElement], value: str | None = None) -> list[bool]:
+        """
+        Verifica se cada elemento do seletor está habilitado, em uma única chamada ao navegador.
+        Não aguarda os elementos: retorna o estado atual da página.
+
+        Args:
+            by: O método de localização, ou uma lista de WebElements já encontrados.
+            value: O valor do seletor. Não usado com uma lista de WebElements.
+        """
+        return self._map_elements("Verificando habilitação", by, value, _JS_ENABLED)
+
+    def are_displayed(self, by: str | list[WebElement], value: str | None = None) -> list[bool]:
+        """
+        Verifica se cada elemento do seletor ocupa espaço na página, em uma única chamada ao navegador.
+        Não aguarda os elementos: retorna o estado atual da página.
+
+        Args:
+            by: O método de localização, ou uma lista de WebElements já encontrados.
+            value: O valor do seletor. Não usado com uma lista de WebElements.
+        """
+        return self._map_elements("Verificando visibilidade", by, value, _JS_DISPLAYED)
+
+    def map_elements(self, by: str | list[WebElement], value: str | None, js_body: str, *args) -> list[Any]:
+        """
+        Executa um trecho de JavaScript para cada elemento do seletor, todos em uma única chamada
+        ao navegador, e retorna a lista de resultados. Não aguarda os elementos: usa o estado atual da página.
+
+        Exemplo: driver.map_elements('css selector', 'tr', 'return element.cells.length;')
+
+        Args:
+            by: O método de localização, ou uma lista de WebElements já encontrados.
+            value: O valor do seletor. Não usado com uma lista de WebElements.
+            js_body: Corpo de uma função JavaScript, com acesso a 'element', 'index' e 'args'.
+                O valor retornado por ela é o resultado para o elemento.
+            args: Argumentos adicionais, disponíveis no JavaScript como o array 'args'.
+        """
+        return self._map_elements("Executando script", by, value, js_body, *args)
+
+    @controller.on_error
+    @_evict_stale
     def click(
         self,
         locator: WebElement | tuple[str, str],
@@ -185,26 +761,56 @@ class Driver:
             timeout: Tempo máximo para aguardar o elemento ser clicável.
             poll_frequency: Frequência de polling para verificar se o elemento está clicável.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
+
+        Sem poll_frequency e ignored_exceptions, seletores CSS são aguardados no próprio navegador até
+        estarem visíveis e habilitados, sem alterar o tempo limite de scripts da sessão; os demais
+        locators, apenas até estarem presentes. O clique é
+        então repetido enquanto o elemento estiver coberto ou não interativo. Todas as etapas dividem
+        o mesmo timeout, e TimeoutException é levantada quando ele se esgota.
         """
         
-        self.log.info(f"Aguardando o elemento ser clicável: {describe_element(locator)}")
-        element = self.wait.element_to_be_clickable(
-            locator=locator,
-            timeout=timeout,
-            poll_frequency=poll_frequency,
-            ignored_exceptions=ignored_exceptions
-        )
+        self.log.debug("Aguardando o elemento ser clicável: %s", LazyDescription(locator))
+        locator = self._from_cache(locator)
+
+        if poll_frequency is not None or ignored_exceptions is not None:
+            element = self.wait.element_to_be_clickable(
+                locator=locator,
+                timeout=timeout,
+                poll_frequency=poll_frequency,
+                ignored_exceptions=ignored_exceptions
+            )
+            self.log.info("Clicando no elemento %s", LazyDescription(element))
+            element.click()
+            return
+
+        # Um único prazo para a espera e para as novas tentativas de clique
+        timeout = timeout if timeout is not None else self._default_timeout
+        deadline = time.monotonic() + timeout
+
+        # Seletores CSS são aguardados no navegador, sem uma requisição por tentativa
+        element = None
+        if locator_kind(locator) == BY_TUPLE:
+            by, value = locator
+            if by == 'css selector':
+                element = self._poll_clickable(value, timeout)
+                if element is not None and self._cache_depth:
+                    self._cache_element(locator, element)
 
-        self.log.info(f'Clicando no elemento {describe_element(element)}')
-        element.click()
+        if element is None:
+            element = self._get_element(locator, max(deadline - time.monotonic(), 0))
+
+        self.log.info("Clicando no elemento %s", LazyDescription(element))
+        self._click_when_ready(element, deadline, timeout)
 
     @controller.on_error
+    @_evict_stale
     def hover(
         self,
         locator: WebElement | tuple[str, str],
         timeout: float | None = None,
         poll_frequency: float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        native: bool = True
     ) -> None:
         """
         Move o mouse para cima do elemento especificado.
@@ -214,22 +820,57 @@ class Driver:
             timeout: Tempo máximo para aguardar o elemento ser clicável.
             poll_frequency: Frequência de polling para verificar se o elemento está clicável.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
+            native: Se deve mover o ponteiro real. Se False, apenas dispara os eventos de hover
+                via JavaScript, como em 'hover_js'.
         """
 
-        self.log.info(f"Aguardando o elemento ser clicável para hover: {describe_element(locator)}")
+        if not native:
+            return self.hover_js(locator, timeout, poll_frequency, ignored_exceptions)
+
+        self.log.debug("Aguardando o elemento ser clicável para hover: %s", LazyDescription(locator))
         element = self.wait.element_to_be_clickable(
+            locator=self._from_cache(locator),
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Movendo o mouse para o elemento: %s", LazyDescription(element))
+        self._move_pointer(element)
+
+    @controller.on_error
+    @_evict_stale
+    def hover_js(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None:
+        """
+        Dispara os eventos 'mouseover' e 'mouseenter' no elemento com uma única chamada JavaScript.
+        Suficiente para menus que aparecem no hover, mas não move o ponteiro real: estilos ':hover'
+        do CSS não são aplicados. Para um hover real, use 'hover'.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        element = self._get_element(
             locator=locator,
             timeout=timeout,
             poll_frequency=poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Movendo o mouse para o elemento: {describe_element(element)}")
-        actions = ActionChains(self.driver)
-        actions.move_to_element(element)
-        actions.perform()
+        self.log.info("Disparando hover no elemento: %s", LazyDescription(element))
+        self.driver.execute_script(_JS_HOVER, element)
     
     @controller.on_error
+    @_evict_stale
     def send_keys(
         self,
         locator: WebElement | tuple[str, str],
@@ -237,7 +878,8 @@ class Driver:
         clear: bool = True,
         timeout: float | None = None,
         poll_frequency: float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        scripted: bool = False
     ) -> None:
         """
         Envia teclas para o elemento especificado.
@@ -249,46 +891,142 @@ class Driver:
             timeout: Tempo máximo para aguardar o elemento ser clicável.
             poll_frequency: Frequência de polling para verificar se o elemento está clicável.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
+            scripted: Se deve, com 'clear' ativo e texto simples (sem teclas especiais como Keys.ENTER),
+                definir o valor em uma única chamada, como em 'fast_set_value'.
         """
 
+        # Teclas especiais ficam na área de uso privado do Unicode e não são imprimíveis
+        if scripted and clear and keys.isprintable():
+            return self.fast_set_value(locator, keys, timeout, poll_frequency, ignored_exceptions)
+
         element = self.wait.element_to_be_clickable(
-            locator=locator,
+            locator=self._from_cache(locator),
             timeout=timeout,
             poll_frequency=poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
         if clear:
-            self.log.info(f"Limpando o campo: {describe_element(element)}")
+            self.log.debug("Limpando o campo: %s", LazyDescription(element))
             element.clear()
 
-        self.log.info(f"Enviando texto {keys} para o elemento: {describe_element(element)}")
+        self.log.info("Enviando texto %s para o elemento: %s", keys, LazyDescription(element))
         element.send_keys(keys)
 
+    @controller.on_error
+    @_evict_stale
+    def fast_set_value(
+        self,
+        locator: WebElement | tuple[str, str],
+        keys: str,
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None:
+        """
+        Define o valor do campo com uma única chamada JavaScript, disparando os eventos
+        'input' e 'change', em vez de limpar o campo e enviar as teclas separadamente.
+        Não simula digitação: handlers de teclado (ex: autocomplete) não são acionados,
+        então só deve ser usado em campos validados por 'onchange'. Para digitação real, use 'send_keys'.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            keys: O texto a ser definido no campo.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        element = self._get_element(
+            locator=locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Definindo o texto %s no elemento: %s", keys, LazyDescription(element))
+        self.driver.execute_script(_JS_SET_VALUE, element, keys)
+
     @controller.on_error
     def execute_script(self, script: str, *args) -> Any:
         """
         Executa um script JavaScript e retorna o resultado.
+        Dentro de 'batch', o script é acumulado e nada é retornado.
         
         Args:
             script: O código JavaScript a ser executado.
             *args: Argumentos adicionais a serem passados para o script.
         """
-        self.log.info(f"Executando script: {script} com argumentos: {args}")
+        if self._js_batch is not None:
+            self.log.info("Acumulando script: %s com argumentos: %s", script, args)
+            self._js_batch.append((script, args))
+            return None
+
+        self.log.info("Executando script: %s com argumentos: %s", script, args)
         return self.driver.execute_script(script, *args)
 
+    @contextmanager
+    def batch(self) -> Generator[Self, None, None]:
+        """
+        Acumula os scripts executados no bloco ('execute_script', 'scroll_to_top', 'scroll_to_bottom',
+        'scroll_to_element') e os envia ao navegador em uma única chamada ao sair.
+        Os resultados dos scripts acumulados são descartados. Se o bloco falhar, nada é enviado.
+
+        Atenção à ordem: apenas scripts são acumulados. Os demais comandos do bloco ('click',
+        'send_keys', 'get', buscas de elementos etc.) são executados imediatamente e, portanto,
+        ANTES de todos os scripts acumulados, mesmo que apareçam depois deles no bloco. Use o bloco
+        apenas para scripts independentes entre si e dos outros comandos.
+        """
+
+        if self._js_batch is not None:
+            yield self
+            return
+
+        self._js_batch = []
+        try:
+            yield self
+            scripts = self._js_batch
+        finally:
+            self._js_batch = None
+
+        if scripts:
+            self._flush_batch(scripts)
+
+    def _flush_batch(self, scripts: list[tuple[str, tuple]]) -> None:
+        """Envia os scripts acumulados, cada um em sua própria função e com os seus argumentos."""
+
+        parts = []
+        args = []
+        for script, script_args in scripts:
+            start = len(args)
+            args.extend(script_args)
+            # O script fica em linhas próprias: um comentário '//' na última linha não pode engolir o fechamento
+            parts.append(f"(function() {{\n{script}\n}}).apply(null, Array.prototype.slice.call(arguments, {start}, {len(args)}));")
+
+        self.log.info("Executando %s scripts em lote", len(scripts))
+        self.driver.execute_script("\n".join(parts), *args)
+
     @controller.on_error
     def switch_to_window(self, window_index: int = -1) -> None:
-        """Muda o foco para uma janela/aba diferente."""
+        """
+        Muda o foco para uma janela/aba diferente.
+        A lista de janelas é sempre buscada no navegador: scripts, formulários e o próprio usuário
+        podem abrir ou fechar janelas a qualquer momento.
+        """
+
         all_windows = self.driver.window_handles
-        self.log.info(f"Alterando para a janela/aba de índice {window_index}. Total de janelas: {len(all_windows)}")
+        self.log.info("Alterando para a janela/aba de índice %s. Total de janelas: %s", window_index, len(all_windows))
         try:
-            self.driver.switch_to.window(all_windows[window_index])
+            handle = all_windows[window_index]
         except IndexError:
-            self.log.error(f"Índice da janela {window_index} fora do intervalo. Total de janelas: {len(all_windows)}")
+            self.log.error("Índice da janela %s fora do intervalo. Total de janelas: %s", window_index, len(all_windows))
             raise
+
+        self.invalidate_cache()
+        self.driver.switch_to.window(handle)
     
     @controller.on_error
+    @_evict_stale
     def get_text(
         self,
         locator: WebElement | tuple[str, str],
@@ -312,10 +1050,11 @@ class Driver:
             poll_frequency=poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
-        self.log.info(f"Obtendo texto do elemento: {describe_element(element)}")
+        self.log.info("Obtendo texto do elemento: %s", LazyDescription(element))
         return element.text
     
     @controller.on_error
+    @_evict_stale
     def is_displayed(
         self,
         locator: WebElement | tuple[str, str],
@@ -340,10 +1079,11 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
         
-        self.log.info(f"Verificando visibilidade do elemento: {locator}")
+        self.log.info("Verificando visibilidade do elemento: %s", locator)
         return element.is_displayed()
 
     @controller.on_error
+    @_evict_stale
     def is_enabled(
         self,
         locator: WebElement | tuple[str,str],
@@ -368,7 +1108,7 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Verificando se o elemento está habilitado: {describe_element(element)}")
+        self.log.info("Verificando se o elemento está habilitado: %s", LazyDescription(element))
         return element.is_enabled()
 
     def get_title(self) -> str:
@@ -382,6 +1122,7 @@ class Driver:
         return self.driver.current_url
     
     @controller.on_error
+    @_evict_stale
     def scroll_to_element(
         self,
         locator: WebElement | tuple[str, str],
@@ -397,6 +1138,141 @@ class Driver:
             timeout: Tempo máximo para aguardar o elemento estar presente.
             poll_frequency: Frequência de polling para verificar a presença do elemento.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
+
+        Seletores CSS já presentes na página são localizados e rolados em uma única chamada.
+        """
+
+        locator = self._from_cache(locator)
+
+        # Caminho rápido: busca e rolagem no mesmo script. Dentro de 'batch' o script não retorna nada
+        if self._js_batch is None and locator_kind(locator) == BY_TUPLE and locator[0] == 'css selector':
+            if self.driver.execute_script(_JS_SCROLL_TO_SELECTOR, locator[1]) is not None:
+                self.log.info("Scrollando a página até o elemento: %s", LazyDescription(locator))
+                return
+
+        element = self._get_element(
+            locator=locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Scrollando a página até o elemento: %s", LazyDescription(element))
+        self.execute_script(_JS_SCROLL_TO_ELEMENT, element)
+
+    @controller.on_error
+    @_evict_stale
+    def scroll_and_check(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> dict[str, Any]:
+        """
+        Rola a página até o elemento e verifica sua visibilidade com uma única chamada JavaScript.
+        Retorna um dicionário com 'visible' (dentro da tela e não coberto por outro elemento)
+        e a posição 'x' e 'y' do elemento na tela.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        element = self._get_element(
+            locator=locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Scrollando a página e verificando o elemento: %s", LazyDescription(element))
+        return self.driver.execute_script(_JS_SCROLL_AND_CHECK, element)
+
+    @controller.on_error
+    @_evict_stale
+    def scroll_and_click(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None:
+        """
+        Rola a página até o elemento e clica nele com uma única chamada JavaScript.
+        O clique via JavaScript não simula o mouse: não dispara hover/foco e ignora
+        elementos sobrepostos. Para um clique real, use 'click'.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        element = self._get_element(
+            locator=locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Scrollando e clicando no elemento: %s", LazyDescription(element))
+        self.driver.execute_script(_JS_SCROLL_AND_CLICK, element)
+
+    @controller.on_error
+    @_evict_stale
+    def scroll_and_get_text(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> str:
+        """
+        Rola a página até o elemento e retorna o seu texto visível com uma única chamada JavaScript.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        element = self._get_element(
+            locator=locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions
+        )
+
+        self.log.info("Scrollando e obtendo texto do elemento: %s", LazyDescription(element))
+        return self.driver.execute_script(_JS_SCROLL_AND_GET_TEXT, element)
+
+    @controller.on_error
+    @_evict_stale
+    def scroll_and_send_keys(
+        self,
+        locator: WebElement | tuple[str, str],
+        keys: str,
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None:
+        """
+        Rola a página até o campo, foca e define o seu valor com uma única chamada JavaScript,
+        disparando os eventos 'input' e 'change'. O valor anterior é substituído.
+        Não simula digitação: handlers de teclado (ex: autocomplete) não são acionados.
+        Para digitação real, use 'send_keys'.
+
+        Args:
+            locator: O WebElement ou tupla (by, value) do seletor.
+            keys: O texto a ser definido no campo.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
 
         element = self._get_element(
@@ -406,22 +1282,23 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Scrollando a página até o elemento: {describe_element(element)}")
-        self.execute_script("arguments[0].scrollIntoView(true);", element)
+        self.log.info("Scrollando e definindo o texto %s no elemento: %s", keys, LazyDescription(element))
+        self.driver.execute_script(_JS_SCROLL_AND_SET_VALUE, element, keys)
 
     @controller.on_error
     def scroll_to_bottom(self) -> None:
         """Rola a página até o final."""
         self.log.info("Scrollando a página até o final")
-        self.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.execute_script(_JS_SCROLL_BOTTOM)
 
     @controller.on_error
     def scroll_to_top(self) -> None:
         """Rola a página até o topo."""
         self.log.info("Scrollando a página até o topo")
-        self.execute_script("window.scrollTo(0, 0);")
+        self.execute_script(_JS_SCROLL_TOP)
     
     @controller.on_error
+    @_evict_stale
     def select_by_value(
         self,
         locator: WebElement | tuple[str, str],
@@ -448,11 +1325,12 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Selecionando opção com value '{value}' no dropdown: {describe_element(element)}")
-        select = Select(element)
+        self.log.info("Selecionando opção com value '%s' no dropdown: %s", value, LazyDescription(element))
+        select = self._select(element)
         select.select_by_value(value)
 
     @controller.on_error
+    @_evict_stale
     def select_by_visible_text(
         self,
         locator: WebElement | tuple[str, str],
@@ -479,11 +1357,12 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Selecionando opção com texto visível '{text}' no dropdown: {describe_element(element)}")
-        select = Select(element)
+        self.log.info("Selecionando opção com texto visível '%s' no dropdown: %s", text, LazyDescription(element))
+        select = self._select(element)
         select.select_by_visible_text(text)
     
     @controller.on_error
+    @_evict_stale
     def get_attribute(
         self,
         locator: WebElement | tuple[str, str],
@@ -510,7 +1389,7 @@ class Driver:
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Obtendo atributo '{attribute}' do elemento: {describe_element(element)}")
+        self.log.info("Obtendo atributo '%s' do elemento: %s", attribute, LazyDescription(element))
         return element.get_attribute(attribute)
 
     @controller.on_error
@@ -530,7 +1409,7 @@ class Driver:
             poll_frequency: Frequência de polling para verificar a visibilidade do elemento.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
-        self.log.info(f"Aguardando elemento ficar visível: {locator}")
+        self.log.info("Aguardando elemento ficar visível: %s", locator)
         return self.wait.visibility_of_element_located(
             locator=locator,
             timeout=timeout,
@@ -555,7 +1434,7 @@ class Driver:
             poll_frequency: Frequência de polling para verificar a invisibilidade do elemento.
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
-        self.log.info(f"Aguardando elemento ficar invisível: {locator}")
+        self.log.info("Aguardando elemento ficar invisível: %s", locator)
         return self.wait.invisibility_of_element_located(
             locator=locator,
             timeout=timeout,
@@ -564,6 +1443,49 @@ class Driver:
         )
 
     @controller.on_error
+    def wait_all(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> list[WebElement]:
+        """
+        Aguarda até que todos os elementos estejam presentes, verificando-os no mesmo ciclo de polling.
+
+        Args:
+            locators: Lista de tuplas (by, value) dos seletores.
+            timeout: Tempo máximo para aguardar os elementos.
+            poll_frequency: Frequência de polling para verificar a presença dos elementos.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+        self.log.info("Aguardando %s elementos estarem presentes", len(locators))
+        conditions = [_EC_PRESENCE(locator) for locator in locators]
+        return self.wait.until(_EC_ALL_OF(*conditions), timeout, poll_frequency, ignored_exceptions)
+
+    @controller.on_error
+    def wait_any(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> WebElement:
+        """
+        Aguarda até que algum dos elementos esteja presente e o retorna.
+
+        Args:
+            locators: Lista de tuplas (by, value) dos seletores.
+            timeout: Tempo máximo para aguardar os elementos.
+            poll_frequency: Frequência de polling para verificar a presença dos elementos.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+        self.log.info("Aguardando algum de %s elementos estar presente", len(locators))
+        conditions = [_EC_PRESENCE(locator) for locator in locators]
+        return self.wait.until(_EC_ANY_OF(*conditions), timeout, poll_frequency, ignored_exceptions)
+
+    @controller.on_error
+    @_evict_stale
     def double_click(
         self,
         locator: WebElement | tuple[str, str],
@@ -581,20 +1503,19 @@ class Driver:
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
 
-        self.log.info(f"Aguardando o elemento ser clicável para duplo clique: {describe_element(locator)}")
+        self.log.debug("Aguardando o elemento ser clicável para duplo clique: %s", LazyDescription(locator))
         element = self.wait.element_to_be_clickable(
-            locator=locator,
+            locator=self._from_cache(locator),
             timeout=timeout,
             poll_frequency=poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Realizando duplo clique no elemento: {describe_element(element)}")
-        actions = ActionChains(self.driver)
-        actions.double_click(element)
-        actions.perform()
+        self.log.info("Realizando duplo clique no elemento: %s", LazyDescription(element))
+        self._perform_actions('double_click', element)
 
     @controller.on_error
+    @_evict_stale
     def right_click(
         self,
         locator: WebElement | tuple[str, str],
@@ -612,36 +1533,95 @@ class Driver:
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
 
-        self.log.info(f"Aguardando o elemento ser clicável para clique direito: {describe_element(locator)}")
+        self.log.debug("Aguardando o elemento ser clicável para clique direito: %s", LazyDescription(locator))
         element = self.wait.element_to_be_clickable(
-            locator=locator,
+            locator=self._from_cache(locator),
             timeout=timeout,
             poll_frequency=poll_frequency,
             ignored_exceptions=ignored_exceptions
         )
 
-        self.log.info(f"Realizando clique direito no elemento: {describe_element(element)}")
-        actions = ActionChains(self.driver)
-        actions.context_click(element)
-        actions.perform()
+        self.log.info("Realizando clique direito no elemento: %s", LazyDescription(element))
+        self._perform_actions('context_click', element)
 
     @controller.on_error
     def refresh(self) -> None:
         """Atualiza a página atual."""
         self.log.info("Atualizando a página")
+        self.invalidate_cache()
         self.driver.refresh()
 
     @controller.on_error
     def back(self) -> None:
         """Navega para a página anterior no histórico."""
         self.log.info("Navegando para a página anterior")
+        self.invalidate_cache()
         self.driver.back()
 
     @controller.on_error
     def forward(self) -> None:
         """Navega para a próxima página no histórico."""
         self.log.info("Navegando para a próxima página")
+        self.invalidate_cache()
         self.driver.forward()
+
+    def locator(self, by: str, value: str) -> Locator:
+        """
+        Cria um Locator reutilizável. Chamá-lo com o driver retorna o elemento, buscado uma única vez
+        até a próxima navegação, e ele pode ser passado diretamente aos métodos que recebem um locator.
+
+        Args:
+            by: O método de localização.
+            value: O valor do seletor.
+        """
+        return Locator(by, value)
+
+    @controller.on_error
+    def cached(
+        self,
+        locator: tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> WebElement:
+        """
+        Retorna o elemento do locator, reaproveitando uma busca anterior se houver.
+        O elemento fica em cache e é reutilizado pelos métodos que recebem o mesmo locator,
+        até a próxima navegação ou até expirar (StaleElementReferenceException).
+
+        Args:
+            locator: Tupla (by, value) do seletor.
+            timeout: Tempo máximo para aguardar o elemento estar presente.
+            poll_frequency: Frequência de polling para verificar a presença do elemento.
+            ignored_exceptions: Exceções a serem ignoradas durante a espera.
+        """
+
+        return self.find_element(
+            *locator,
+            timeout=timeout,
+            poll_frequency=poll_frequency,
+            ignored_exceptions=ignored_exceptions,
+            cache=True
+        )
+
+    @contextmanager
+    def cache_elements(self) -> Generator[Self, None, None]:
+        """
+        Dentro do bloco, os elementos localizados por tupla (by, value) ficam em cache e são
+        reaproveitados pelos métodos seguintes com o mesmo locator, como em 'cached'.
+        Elementos expirados são localizados novamente de forma transparente.
+        """
+
+        self._cache_depth += 1
+        try:
+            yield self
+        finally:
+            self._cache_depth -= 1
+
+    def invalidate_cache(self) -> None:
+        """Descarta os elementos em cache. Chamado automaticamente ao navegar ou trocar de janela."""
+        self._element_cache.clear()
+        self._select_cache.clear()
     
     def save_screenshot(self: 'Driver', exception: Exception | None = None) -> None:
         """
@@ -655,26 +1635,103 @@ class Driver:
             self.log.warning("Tentativa de salvar screenshot com driver não inicializado")
             return
         
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        number = next(_screenshot_counter)
         if exception is None:
-            file_name = f"{timestamp}.png"
+            file_name = f"{_SESSION_TIMESTAMP}_{number}.png"
         else:
-            file_name = f"{timestamp}_{exception.__class__.__name__}.png"
+            file_name = f"{_SESSION_TIMESTAMP}_{number}_{exception.__class__.__name__}.png"
+
+        file_path = f"{self._screenshot_dir}/{file_name}"
 
-        file_path = os.path.join(Config.SCREENSHOT_DIR, file_name)
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
         try:
-            self.driver.save_screenshot(file_path)
-            self.log.info(f"Screenshot salvo em: {file_path}")
+            data = self._capture_screenshot_base64()
         except Exception as e:
-            self.log.error(f"Erro ao salvar screenshot: {e}")
+            self.log.error("Erro ao salvar screenshot: %s", e)
+            return
+
+        # A decodificação e a gravação em disco são feitas em segundo plano para não atrasar o tratamento do erro
+        if self._io_pool is None:
+            self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='drv-io')
+        self._io_pool.submit(self._write_png, file_path, data)
+
+    def run_parallel(self, tasks: list[Callable[['Driver'], T]], workers: int | None = None) -> list[T]:
+        """
+        Executa tarefas independentes em paralelo, cada thread com o seu próprio Driver, criado com
+        as mesmas configurações deste. Os drivers são reaproveitados entre as tarefas de uma mesma
+        thread e fechados ao final. Retorna os resultados na ordem das tarefas.
+
+        Threads são suficientes: o tempo é gasto aguardando o navegador, e não no Python.
+
+        Args:
+            tasks: Funções que recebem um Driver já iniciado.
+            workers: Quantidade de drivers simultâneos. Padrão: um por tarefa.
+        """
+
+        if not tasks:
+            return []
+
+        workers = min(workers or len(tasks), len(tasks))
+        self.log.info("Executando %s tarefas em %s drivers", len(tasks), workers)
+
+        local = threading.local()
+        drivers: list[Driver] = []
+        lock = threading.Lock()
+
+        def run(task: Callable[['Driver'], T]) -> T:
+            driver = getattr(local, 'driver', None)
+            if driver is None:
+                driver = local.driver = self._copy()
+                with lock:
+                    drivers.append(driver)
+                driver.init()
+            return task(driver)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='drv-parallel') as executor:
+                return list(executor.map(run, tasks))
+        finally:
+            for driver in drivers:
+                # Fecha o driver e aguarda a gravação dos screenshots pendentes
+                driver.__exit__(None, None, None)
+
+    def _copy(self) -> 'Driver':
+        """Cria um novo Driver, ainda não iniciado, com as mesmas configurações deste."""
+
+        # Um Service comum controla um único processo: apenas o compartilhado pode ser reaproveitado
+        service = self._service if isinstance(self._service, _PersistentService) else None
+
+        # A cópia não registra o próprio save_screenshot no controller global, que deve continuar
+        # apontando para este Driver, e não para um driver de trabalho que será fechado
+        copy = Driver(
+            options=self._options,
+            service=service,
+            keep_alive=self._keep_alive,
+            driver_cls=self._driver_cls,
+            save_screenshot_on_error=False,
+            default_timeout=self._default_timeout,
+            default_poll_frequency=self._default_poll_frequency,
+            default_ignored_exceptions=self._default_ignored_exceptions,
+            logger=self.log._logger,
+            log_level=self._log_level,
+            log_file_path=self._log_file_path,
+            log_indent=self.log._indent,
+            pool=self._pool,
+            pool_maxsize=self._pool_maxsize,
+            strict_explicit_waits=self._strict_explicit_waits,
+            heartbeat_interval=self._heartbeat_interval,
+            page_load_strategy=self._page_load_strategy,
+            reuse_service=self._reuse_service,
+            fast_mode=self._fast_mode,
+            reuse_browser=self._reuse_browser
+        )
+        copy.save_screenshot_on_error = self.save_screenshot_on_error
+        return copy
 
     def step(
         self,
         description: str,
         log_level: int = logging.INFO,
-        exception_handler: Callable | None = None,
+        exception_handler: Callable | Mapping[type[Exception], Callable] | None = None,
         retries: int = 0,
         retry_delay: float = 0.0
     ) -> Callable[[Callable[P, T]], Callable[P, T]]:
@@ -684,7 +1741,8 @@ class Driver:
         Args:
             description: Descrição do passo a ser registrado.
             log_level: Nível de log para o passo.
-            exception_handler: Função para tratar exceções, se necessário.
+            exception_handler: Função para tratar exceções, se necessário, ou um dicionário
+                que associa tipos de exceção a tratadores (subclasses também são tratadas).
             retries: Número de vezes que a operação deve ser repetida em caso de falha.
             retry_delay: Tempo de espera entre as tentativas.
         """
@@ -716,23 +1774,489 @@ class Driver:
             ignored_exceptions: Exceções a serem ignoradas durante a espera.
         """
 
-        if is_web_element(locator):
+        locator = self._from_cache(locator)
+        if locator_kind(locator) == WEB_ELEMENT:
             return locator
 
         return self.find_element(
             *locator,
             timeout=timeout,
             poll_frequency=poll_frequency,
-            ignored_exceptions=ignored_exceptions
+            ignored_exceptions=ignored_exceptions,
+            cache=self._cache_depth > 0
         )
 
+    def _poll_clickable(self, selector: str, timeout: float | None) -> WebElement | None:
+        """
+        Aguarda o elemento do seletor CSS ser clicável com uma única chamada assíncrona,
+        fazendo o polling no navegador em vez de uma requisição por tentativa.
+        O tempo limite de scripts da sessão não é alterado: a espera no navegador dura no máximo
+        até pouco antes dele. Levanta TimeoutException se o timeout se esgotar. Retorna None caso
+        a espera no navegador termine antes do timeout, para que a espera padrão seja usada no tempo restante.
+        """
+
+        timeout = timeout if timeout is not None else self._default_timeout
+        browser_timeout = min(timeout, self._get_script_timeout() - _SCRIPT_TIMEOUT_MARGIN)
+        if browser_timeout <= 0:
+            return None
+
+        try:
+            element = self.driver.execute_async_script(
+                _JS_POLL_CLICKABLE, selector, browser_timeout * 1000, _POLL_CLICKABLE_INTERVAL_MS
+            )
+        except TimeoutException:
+            # Tempo limite de scripts reduzido durante a sessão, após ter sido consultado
+            return None
+
+        if element is not None:
+            return element
+        if browser_timeout < timeout:
+            return None
+        raise TimeoutException(f'Elemento (css selector="{selector}") não ficou clicável em {timeout} segundos')
+
+    def _get_script_timeout(self) -> float:
+        """Retorna o tempo limite de scripts assíncronos da sessão, consultado uma única vez por sessão."""
+        if self._script_timeout is None:
+            self._script_timeout = self.driver.timeouts.script
+        return self._script_timeout
+
+    def _click_when_ready(self, element: WebElement, deadline: float, timeout: float) -> None:
+        """
+        Clica no elemento, tentando novamente enquanto ele estiver coberto ou não interativo.
+        Levanta TimeoutException, assim como a espera padrão, caso o prazo (time.monotonic) se esgote.
+        """
+
+        while True:
+            try:
+                element.click()
+                return
+            except (ElementClickInterceptedException, ElementNotInteractableException) as e:
+                if time.monotonic() >= deadline:
+                    raise TimeoutException(f'Elemento não ficou clicável em {timeout} segundos') from e
+                time.sleep(_CLICK_RETRY_INTERVAL)
+
+    def _find_element_now(
+        self,
+        by: str,
+        value: str,
+        timeout: float,
+        interval: float = _FAST_FIND_INTERVAL,
+        backoff: bool = False
+    ) -> WebElement:
+        """
+        Procura o elemento diretamente no driver, tentando novamente até esgotar o timeout.
+        Levanta TimeoutException, assim como a espera padrão.
+
+        Args:
+            by: O método de localização.
+            value: O valor do seletor.
+            timeout: Tempo máximo para encontrar o elemento.
+            interval: Intervalo entre as tentativas.
+            backoff: Se deve dobrar o intervalo a cada tentativa, até MAX_POLL_FREQUENCY.
+        """
+
+        max_interval = max(interval, MAX_POLL_FREQUENCY)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                return self.driver.find_element(by, value)
+            except NoSuchElementException as e:
+                if time.monotonic() >= deadline:
+                    raise TimeoutException(f'Elemento ({by}="{value}") não encontrado em {timeout} segundos') from e
+                time.sleep(interval)
+                if backoff:
+                    interval = min(interval * 2, max_interval)
+
+    def _find_element_implicit(self, by: str, value: str, timeout: float | None) -> WebElement:
+        """
+        Procura o elemento diretamente e, se ainda não estiver na página, aguarda por ele
+        com a espera implícita do navegador. Levanta TimeoutException, assim como a espera padrão.
+        """
+
+        try:
+            return self.driver.find_element(by, value)
+        except NoSuchElementException:
+            pass
+
+        timeout = timeout if timeout is not None else self._default_timeout
+        try:
+            with self._with_implicit(timeout):
+                return self.driver.find_element(by, value)
+        except NoSuchElementException as e:
+            raise TimeoutException(f'Elemento ({by}="{value}") não encontrado em {timeout} segundos') from e
+
+    @contextmanager
+    def _with_implicit(self, timeout: float) -> Generator[None, None, None]:
+        """
+        Ativa a espera implícita durante o bloco e a zera ao sair, para não somá-la às esperas explícitas.
+        Só envia o comando ao navegador quando o valor muda.
+        """
+
+        if self._implicit_timeout != timeout:
+            self.driver.implicitly_wait(timeout)
+            self._implicit_timeout = timeout
+        try:
+            yield
+        finally:
+            if self._implicit_timeout:
+                self.driver.implicitly_wait(0)
+                self._implicit_timeout = 0
+
+    def _map_elements(
+        self,
+        action: str,
+        by: str | list[WebElement],
+        value: str | None,
+        js_body: str,
+        *args
+    ) -> list[Any]:
+        """
+        Executa 'js_body' para cada elemento em uma única chamada ao navegador. Veja 'map_elements'.
+
+        Args:
+            action: Descrição da operação, usada no log.
+            by: O método de localização, ou uma lista de WebElements já encontrados.
+            value: O valor do seletor.
+            js_body: Corpo da função JavaScript executada para cada elemento.
+            args: Argumentos adicionais, disponíveis no JavaScript como o array 'args'.
+        """
+
+        # WebElements já encontrados são enviados ao navegador na própria chamada
+        if type(by) is list:
+            self.log.info("%s de %s elementos", action, len(by))
+            return self.driver.execute_script(_JS_MAP_GIVEN % js_body, by, *args)
+
+        self.log.info("%s dos elementos por %s='%s'", action, by, value)
+        results = self.driver.execute_script(_JS_MAP_ELEMENTS % js_body, by, value, *args)
+        if results is None:
+            # Estratégias sem equivalente no navegador (ex: 'link text'): os elementos são buscados antes
+            elements = self.driver.find_elements(by, value)
+            return self.driver.execute_script(_JS_MAP_GIVEN % js_body, elements, *args)
+        return results
+
+    def _select(self, element: WebElement) -> 'Select':
+        """
+        Retorna o Select do elemento, reaproveitado enquanto o elemento for o mesmo.
+        A criação de um Select consulta o navegador duas vezes (tag e atributo 'multiple').
+        """
+
+        select = self._select_cache.get(element.id)
+        if select is None:
+            from selenium.webdriver.support.ui import Select  # Importado sob demanda
+            select = self._select_cache[element.id] = Select(element)
+        return select
+
+    def _move_pointer(self, element: WebElement) -> None:
+        """
+        Move o ponteiro do mouse para o centro do elemento, enviando o comando W3C de ações diretamente,
+        sem montar um ActionChains.
+        """
+
+        from selenium.webdriver.remote.command import Command  # Importado sob demanda
+        self.driver.execute(Command.W3C_ACTIONS, {
+            'actions': [{
+                'type': 'pointer',
+                'id': 'mouse',
+                'parameters': {'pointerType': 'mouse'},
+                'actions': [{
+                    'type': 'pointerMove',
+                    'duration': 0,
+                    'x': 0,
+                    'y': 0,
+                    'origin': {_W3C_ELEMENT_KEY: element.id}
+                }]
+            }]
+        })
+
+    def _perform_actions(self, action: str, element: WebElement) -> None:
+        """
+        Executa uma ação do ActionChains no elemento, reaproveitando a mesma instância entre as chamadas.
+
+        Args:
+            action: Nome do método do ActionChains, como 'move_to_element' ou 'double_click'.
+            element: O WebElement alvo da ação.
+        """
+
+        if self._actions is None:
+            from selenium.webdriver.common.action_chains import ActionChains  # Importado sob demanda
+            self._actions = ActionChains(self.driver)
+
+        # 'perform' já esvazia a fila de ações de cada dispositivo
+        try:
+            getattr(self._actions, action)(element)
+            self._actions.perform()
+        except Exception:
+            # Ações enfileiradas e não enviadas não podem vazar para a próxima chamada
+            self._actions = None
+            raise
+
+    def _capture_screenshot_base64(self) -> str:
+        """
+        Captura o screenshot da página atual. Deve rodar na thread do driver, que não é thread-safe.
+        Em navegadores Chromium, a captura é feita diretamente pelo DevTools Protocol.
+        """
+
+        driver = self.driver
+        if isinstance(driver, ChromiumDriver):
+            try:
+                return driver.execute_cdp_cmd('Page.captureScreenshot', {'format': 'png'})['data']
+            except Exception as e:
+                # Sessões remotas podem não expor o DevTools Protocol
+                self.log.debug("Captura via DevTools indisponível, usando o comando padrão: %s", e)
+        return driver.get_screenshot_as_base64()
+
+    def _write_png(self, file_path: str, data: str) -> None:
+        """Decodifica e grava o screenshot em disco. Executado na thread de I/O."""
+
+        try:
+            png = base64.b64decode(data.encode('ascii'))
+
+            # O diretório é criado apenas quando há um screenshot a gravar, e recriado se tiver sido removido
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            with open(file_path, 'wb') as file:
+                file.write(png)
+            self.log.info("Screenshot salvo em: %s", file_path)
+        except Exception as e:
+            self.log.error("Erro ao salvar screenshot: %s", e)
+
+    def _from_cache(self, locator: WebElement | tuple[str, str]) -> WebElement | tuple[str, str]:
+        """
+        Retorna o elemento em cache para o locator, se houver. Caso contrário, retorna o próprio locator.
+        O locator é validado antes da consulta, para que tipos inválidos levantem o TypeError padrão.
+        """
+        if locator_kind(locator) == WEB_ELEMENT:
+            return locator
+
+        element = self._element_cache.get(locator)
+        if element is None:
+            return locator
+        self._element_cache.move_to_end(locator)
+        return element
+
+    def _cache_element(self, locator: tuple[str, str], element: WebElement) -> None:
+        """Guarda o elemento no cache, descartando o menos usado recentemente se estiver cheio."""
+        self._element_cache[locator] = element
+        self._element_cache.move_to_end(locator)
+        if len(self._element_cache) > _ELEMENT_CACHE_MAXSIZE:
+            self._element_cache.popitem(last=False)
+
     def _start_driver(self) -> WebDriver:
-        """Inicia o driver Selenium com as configurações fornecidas."""
-        return self._driver_cls(self._options, self._service, self._keep_alive)
-    
+        """Inicia o driver Selenium com as configurações fornecidas, ou retira um do pool."""
+        if self._pool is not None:
+            driver = self._pool.acquire(timeout=self._default_timeout)
+        else:
+            options = self._attach_options() if self._reuse_browser else self._options
+            driver = self._driver_cls(options, self._service, self._keep_alive)
+            self._resize_connection_pool(driver)
+
+        # A espera implícita só é usada pelo driver quando se sabe que está zerada
+        self._implicit_timeout = None
+        self._script_timeout = None
+        if self._strict_explicit_waits:
+            driver.implicitly_wait(0)
+            self._implicit_timeout = 0
+
+        if self._heartbeat_interval:
+            self._start_heartbeat(driver)
+        return driver
+
+    def _attach_options(self) -> Options:
+        """Retorna opções que conectam o driver ao navegador reaproveitado, iniciando-o se necessário."""
+
+        if self._browser_process is None or self._browser_process.poll() is not None:
+            self._launch_browser()
+
+        options = Options()
+        options.debugger_address = self._debugger_address
+        if self._options is not None:
+            options.page_load_strategy = self._options.page_load_strategy
+        return options
+
+    def _launch_browser(self) -> None:
+        """
+        Inicia o Chrome com depuração remota e um perfil temporário, e aguarda até que aceite conexões.
+        A porta é escolhida pelo próprio Chrome, que a informa no arquivo 'DevToolsActivePort' do perfil,
+        para que nenhum outro processo a ocupe entre a escolha e o uso.
+        """
+
+        options = self._options if self._options is not None else Options()
+        binary = options.binary_location
+        if not binary:
+            from selenium.webdriver.common.driver_finder import DriverFinder  # Importado sob demanda
+            binary = DriverFinder(Service(), options).get_browser_path()
+        if not binary:
+            raise RuntimeError("Não foi possível localizar o executável do Chrome para 'reuse_browser'")
+
+        # Um navegador anterior que tenha encerrado sozinho ainda pode ter deixado o perfil
+        self._shutdown_browser()
+
+        self.log.info("Iniciando navegador reaproveitável")
+        self._browser_profile_dir = tempfile.mkdtemp(prefix="selenium_core_")
+        try:
+            self._browser_process = subprocess.Popen(
+                [
+                    binary,
+                    '--remote-debugging-port=0',
+                    f'--user-data-dir={self._browser_profile_dir}',
+                    *options.arguments
+                ],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+        except Exception:
+            self._close_browser()
+            raise
+        atexit.register(self._close_browser)
+
+        try:
+            port = self._wait_for_browser()
+        except Exception:
+            self._shutdown_browser()
+            raise
+
+        self.log.info("Navegador reaproveitável aceitando conexões na porta %s", port)
+        self._debugger_address = f'127.0.0.1:{port}'
+
+    def _wait_for_browser(self) -> int:
+        """Aguarda o Chrome informar a porta de depuração e aceitar conexões nela. Retorna a porta."""
+
+        port_file = os.path.join(self._browser_profile_dir, 'DevToolsActivePort')
+        deadline = time.monotonic() + self._default_timeout
+        while True:
+            if self._browser_process.poll() is not None:
+                raise RuntimeError("O navegador reaproveitável foi encerrado ao iniciar")
+
+            try:
+                with open(port_file, encoding='utf-8') as f:
+                    port = int(f.readline())
+            except (OSError, ValueError):
+                port = None
+
+            if port:
+                try:
+                    socket.create_connection(('127.0.0.1', port), timeout=_BROWSER_READY_INTERVAL).close()
+                    return port
+                except OSError:
+                    pass
+
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"O navegador reaproveitável não aceitou conexões após {self._default_timeout} segundos")
+            time.sleep(_BROWSER_READY_INTERVAL)
+
+    def _shutdown_browser(self) -> None:
+        """Fecha o navegador reaproveitável, se houver, e cancela o seu encerramento ao fim do processo."""
+        if self._browser_process is None:
+            return
+
+        self.log.info("Fechando navegador reaproveitável")
+        atexit.unregister(self._close_browser)
+        self._close_browser()
+
+    def _close_browser(self) -> None:
+        """Encerra o navegador reaproveitável, se houver, e remove o seu perfil temporário."""
+
+        if self._browser_process is not None:
+            if self._browser_process.poll() is None:
+                self._browser_process.terminate()
+                try:
+                    self._browser_process.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    self._browser_process.kill()
+                    self._browser_process.wait()
+            self._browser_process = None
+
+        if self._browser_profile_dir is not None:
+            shutil.rmtree(self._browser_profile_dir, ignore_errors=True)
+            self._browser_profile_dir = None
+        self._debugger_address = None
+
+    def _start_heartbeat(self, driver: WebDriver) -> None:
+        """Inicia a thread que mantém a conexão com o navegador aquecida."""
+
+        if self._heartbeat_thread is not None and self._heartbeat_thread.is_alive():
+            return
+
+        self._heartbeat_stop.clear()
+        self._heartbeat_thread = threading.Thread(
+            target=self._heartbeat,
+            args=(driver, self._heartbeat_stop, self._heartbeat_interval, self.log),
+            name='drv-heartbeat',
+            daemon=True
+        )
+        self._heartbeat_thread.start()
+
+    @staticmethod
+    def _heartbeat(driver: WebDriver, stop: threading.Event, interval: float, log: LogManager) -> None:
+        # Evita que a conexão keep-alive ociosa seja fechada e o próximo comando pague um novo handshake
+        while not stop.wait(interval):
+            try:
+                driver.title
+            except (InvalidSessionIdException, NoSuchWindowException) as e:
+                # Sessão ou janela encerrada: não há mais conexão a manter
+                log.warning("Heartbeat encerrado, a sessão não está mais disponível: %s", e)
+                return
+            except Exception as e:
+                # Falhas passageiras, como uma queda momentânea da rede, não interrompem o heartbeat
+                log.debug("Falha no heartbeat, tentando novamente em %s segundos: %s", interval, e)
+
+    def _stop_heartbeat(self) -> None:
+        """Encerra a thread de heartbeat, se estiver ativa."""
+
+        if self._heartbeat_thread is None:
+            return
+        self._heartbeat_stop.set()
+        self._heartbeat_thread.join()
+        self._heartbeat_thread = None
+
+    def _resize_connection_pool(self, driver: WebDriver) -> None:
+        """
+        Ajusta o tamanho do pool de conexões HTTP usado para enviar comandos ao navegador,
+        permitindo comandos simultâneos (ex: vindos de outras threads) sem disputar um único socket.
+        """
+
+        # O pool só é mantido pela conexão quando keep_alive está ativo
+        connection = getattr(driver.command_executor, '_conn', None)
+        if connection is None:
+            return
+
+        connection.connection_pool_kw['maxsize'] = self._pool_maxsize
+        connection.clear()  # Recria os pools já abertos com o novo tamanho
+
+    def _release_driver(self, healthy: bool) -> None:
+        """
+        Encerra o driver atual ou o devolve ao pool.
+
+        Args:
+            healthy: Se o driver terminou sem erros. Drivers com falha não voltam ao pool.
+        """
+
+        if self._driver is None:
+            return
+
+        self._stop_heartbeat()
+        if self._pool is None:
+            self.log.info("Fechando driver")
+            self._driver.quit()
+        else:
+            self.log.info("Devolvendo driver ao pool")
+            self._pool.release(self._driver, healthy=healthy)
+
+        self._driver = None
+        self._wait = None  # Limpa a instância do wait também
+        self._actions = None
+        self.invalidate_cache()
+
     def __enter__(self) -> Self:
         self.init()
         return self
-    
+
     def __exit__(self, exc_type, exc_value, traceback) -> None:
-        self.quit()
+        self._release_driver(healthy=exc_type is None)
+
+        # Fim do uso do Driver: o navegador mantido por 'reuse_browser' também é fechado
+        self._shutdown_browser()
+
+        # Aguarda a gravação dos screenshots pendentes
+        if self._io_pool is not None:
+            self._io_pool.shutdown(wait=True)
+            self._io_pool = None
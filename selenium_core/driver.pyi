@@ -5,9 +5,12 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
 from selenium.types import WaitExcTypes
 import logging
-from typing import Callable, Self, Any
+from contextlib import AbstractContextManager
+from typing import Callable, Self, Any, Mapping
 from .wait import Wait
 from .log import LogManager
+from .pool import BrowserPool
+from .locator import Locator
 from .types import P, T
 
 
@@ -21,12 +24,20 @@ class Driver:
         driver_cls: type[WebDriver] = Chrome,
         save_screenshot_on_error: bool = True,
         default_timeout: float = 30,
-        default_poll_frequency: float = 0.5,
+        default_poll_frequency: float = 0.1,
         default_ignored_exceptions: WaitExcTypes | None = None,
         logger: logging.Logger | None = None,
         log_level: int | None = None,
         log_file_path: str | None = None,
-        log_indent: int | None = None
+        log_indent: int | None = None,
+        pool: BrowserPool | None = None,
+        pool_maxsize: int = 10,
+        strict_explicit_waits: bool = True,
+        heartbeat_interval: float | None = None,
+        page_load_strategy: str | None = 'eager',
+        reuse_service: bool = False,
+        fast_mode: bool = False,
+        reuse_browser: bool = False
     ) -> None: ...
 
     @property
@@ -41,7 +52,9 @@ class Driver:
 
     def quit(self) -> None: ...
 
-    def get(self, url: str) -> None: ...
+    def shutdown(self) -> None: ...
+
+    def get(self, url: str, wait_selector: str | None = None) -> None: ...
 
     def find_element(
         self,
@@ -49,7 +62,8 @@ class Driver:
         value: str,
         timeout: float | None = None,
         poll_frequency: float | None = None,
-        ignored_exceptions: WaitExcTypes | None = None
+        ignored_exceptions: WaitExcTypes | None = None,
+        cache: bool = False
     ) -> WebElement: ...
 
     def find_elements(
@@ -61,6 +75,35 @@ class Driver:
         ignored_exceptions: WaitExcTypes | None = None
     ) -> list[WebElement]: ...
 
+    def quick_find(self, by: str, value: str) -> WebElement: ...
+
+    def quick_find_all(self, by: str, value: str) -> list[WebElement]: ...
+
+    def find_many(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> list[WebElement]: ...
+
+    def find_elements_multi(self, locators: list[tuple[str, str]], timeout: float | None = None) -> list[WebElement]: ...
+
+    def find_visible_elements(self, by: str, value: str) -> list[WebElement]: ...
+
+    def get_texts(
+        self,
+        by: str | list[WebElement],
+        value: str | None = None,
+        text_content: bool = False
+    ) -> list[str]: ...
+
+    def are_enabled(self, by: str | list[WebElement], value: str | None = None) -> list[bool]: ...
+
+    def are_displayed(self, by: str | list[WebElement], value: str | None = None) -> list[bool]: ...
+
+    def map_elements(self, by: str | list[WebElement], value: str | None, js_body: str, *args) -> list[Any]: ...
+
     def click(
         self,
         locator: WebElement | tuple[str, str],
@@ -70,6 +113,15 @@ class Driver:
     ) -> None: ...
 
     def hover(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None,
+        native: bool = True
+    ) -> None: ...
+
+    def hover_js(
         self,
         locator: WebElement | tuple[str, str],
         timeout: float | None = None,
@@ -84,11 +136,28 @@ class Driver:
         clear: bool = True,
         timeout: float | None = None,
         poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None,
+        scripted: bool = False
+    ) -> None: ...
+
+    def fast_set_value(
+        self,
+        locator: WebElement | tuple[str, str],
+        keys: str,
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
         ignored_exceptions: WaitExcTypes | None = None
     ) -> None: ...
 
     def execute_script(self, script: str, *args) -> Any: ...
 
+    def batch(self) -> AbstractContextManager[Self]:
+        """
+        Acumula os scripts do bloco e os envia em uma única chamada ao sair.
+        Os demais comandos do bloco são executados imediatamente, antes dos scripts acumulados.
+        """
+        ...
+
     def switch_to_window(self, window_index: int = -1) -> None: ...
 
     def get_text(
@@ -127,6 +196,39 @@ class Driver:
         ignored_exceptions: WaitExcTypes | None = None
     ) -> None: ...
 
+    def scroll_and_check(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> dict[str, Any]: ...
+
+    def scroll_and_click(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None: ...
+
+    def scroll_and_get_text(
+        self,
+        locator: WebElement | tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> str: ...
+
+    def scroll_and_send_keys(
+        self,
+        locator: WebElement | tuple[str, str],
+        keys: str,
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> None: ...
+
     def scroll_to_bottom(self) -> None: ...
 
     def scroll_to_top(self) -> None: ...
@@ -174,6 +276,22 @@ class Driver:
         ignored_exceptions: WaitExcTypes | None = None
     ) -> bool: ...
 
+    def wait_all(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> list[WebElement]: ...
+
+    def wait_any(
+        self,
+        locators: list[tuple[str, str]],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> WebElement: ...
+
     def double_click(
         self,
         locator: WebElement | tuple[str, str],
@@ -196,13 +314,29 @@ class Driver:
 
     def forward(self) -> None: ...
 
+    def locator(self, by: str, value: str) -> Locator: ...
+
+    def cached(
+        self,
+        locator: tuple[str, str],
+        timeout: float | None = None,
+        poll_frequency: float | None = None,
+        ignored_exceptions: WaitExcTypes | None = None
+    ) -> WebElement: ...
+
+    def cache_elements(self) -> AbstractContextManager[Self]: ...
+
+    def invalidate_cache(self) -> None: ...
+
     def save_screenshot(self, exception: Exception | None = None) -> None: ...
 
+    def run_parallel(self, tasks: list[Callable[[Driver], T]], workers: int | None = None) -> list[T]: ...
+
     def step(
         self,
         description: str,
         log_level: int = logging.INFO,
-        exception_handler: Callable | None = None,
+        exception_handler: Callable | Mapping[type[Exception], Callable] | None = None,
         retries: int = 0,
         retry_delay: float = 0.0
     ) -> Callable[[Callable[P, T]], Callable[P, T]]: ...
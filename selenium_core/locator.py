@@ -0,0 +1,35 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from selenium.webdriver.remote.webelement import WebElement
+    from .driver import Driver
+
+
+class Locator(tuple):
+    """
+    Tupla (by, value) de um seletor, validada na criação.
+    Chamar o Locator com um Driver retorna o elemento, reaproveitado do cache do Driver
+    até a próxima navegação. Veja 'Driver.cached'.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, by: str, value: str) -> 'Locator':
+        # Subclasses de str, como membros de StrEnum, são aceitas, assim como em 'is_by_tuple'
+        if not isinstance(by, str) or not isinstance(value, str):
+            raise TypeError(f"O 'by' e o 'value' do Locator devem ser do tipo 'str', não {type(by).__name__} e {type(value).__name__}")
+        return tuple.__new__(cls, (by, value))
+
+    @property
+    def by(self) -> str:
+        return self[0]
+
+    @property
+    def value(self) -> str:
+        return self[1]
+
+    def __call__(self, driver: 'Driver', timeout: float | None = None) -> 'WebElement':
+        return driver.cached(self, timeout=timeout)
+
+    def __repr__(self) -> str:
+        return f"Locator({self[0]!r}, {self[1]!r})"
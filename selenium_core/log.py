@@ -1,13 +1,49 @@
 import logging
+import logging.handlers
 import os
-from datetime import datetime
+import threading
 import time
 from typing import Callable
 from .config import Config
 
 
+# Diretórios de log já criados, para não repetir o makedirs a cada logger
+_created_dirs: set[str] = set()
+
+# Garante que loggers criados em paralelo não dupliquem os handlers
+_logger_lock = threading.Lock()
+
+# Registros acumulados antes de cada escrita no arquivo de log
+_LOG_BUFFER_CAPACITY = 512
+
+class _FrozenMemoryHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler que formata a mensagem antes de guardar o registro no buffer.
+    Argumentos avaliados sob demanda, como LazyDescription, consultam o navegador no momento do log,
+    e não quando o buffer é esvaziado, talvez em outra página ou com a sessão já encerrada.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Erros de formatação são tratados pelo logging, e não propagados para quem registrou a mensagem
+        try:
+            record.msg = record.getMessage()
+        except Exception:
+            self.handleError(record)
+            return
+        record.args = None
+        super().emit(record)
+
+
+# Referência local ao relógio, sem a busca do atributo em 'time' a cada passo
+_perf_counter_ns = time.perf_counter_ns
+
+
 class LogManager:
 
+    __slots__ = ('_logger', '_current_indent_level', '_indent', '_indent_cache')
+
+    _FORMATTER = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+
     def __init__(
         self,
         logger: logging.Logger | None = None,
@@ -19,80 +55,132 @@ class LogManager:
         self._logger = logger if logger is not None else self._create_logger(log_level, file_path)
         self._current_indent_level = 0
         self._indent = indent if indent is not None else 3
+        self._indent_cache: dict[int, str] = {}
 
-    def debug(self, message: str) -> None:
-        self._log(logging.DEBUG, message)
+    def debug(self, message: str, *args) -> None:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._emit(logging.DEBUG, message, args)
     
-    def info(self, message: str) -> None:
-        self._log(logging.INFO, message)
+    def info(self, message: str, *args) -> None:
+        if self._logger.isEnabledFor(logging.INFO):
+            self._emit(logging.INFO, message, args)
         
-    def warning(self, message: str) -> None:
-        self._log(logging.WARNING, message)
+    def warning(self, message: str, *args) -> None:
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._emit(logging.WARNING, message, args)
     
-    def error(self, message: str) -> None:
-        self._log(logging.ERROR, message)
+    def error(self, message: str, *args) -> None:
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._emit(logging.ERROR, message, args)
     
-    def critical(self, message: str) -> None:
-        self._log(logging.CRITICAL, message)
+    def critical(self, message: str, *args) -> None:
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._emit(logging.CRITICAL, message, args)
 
     def step(self, description: str, level: int = logging.INFO) -> Callable:
         
+        # Referências resolvidas uma vez por decorador, lidas como variáveis locais a cada passo
+        log = self._log
+        clock = _perf_counter_ns
+        error_level = logging.ERROR
+
         def decorator(func: Callable) -> Callable:
 
             def wrapper(*args, **kwargs):
 
-                self._log(level, f">> {description}")
+                log(level, ">> %s", description)
                 self._current_indent_level += 1
-                start_time = time.perf_counter()
+                start_ns = clock()
                 try:
                     result = func(*args, **kwargs)
                 except Exception as e:
                     self._current_indent_level -= 1
-                    self._log(logging.ERROR, f"<< {description} falhou: {e}")
+                    log(error_level, "<< %s falhou: %s", description, e)
                     raise
                 
                 self._current_indent_level -= 1
 
-                duration = time.perf_counter() - start_time
-                self._log(level, f"<< {description} finalizado com sucesso em {duration:.3f} segundos")
+                duration = (clock() - start_ns) / 1e9
+                log(level, "<< %s finalizado com sucesso em %.3f segundos", description, duration)
                 return result
             
             return wrapper
         
         return decorator
 
-    def _log(self, level: int, message: str, indent: int | None = None) -> None:
-        """Método interno que adiciona indentação antes de logar."""
-        indent = indent if indent is not None else self._indent
-        indent = " " * self._current_indent_level * indent
-        self._logger.log(level, f"{indent}{message}")
+    def _log(self, level: int, message: str, *args, indent: int | None = None) -> None:
+        """
+        Método interno que adiciona indentação antes de logar.
+        Os argumentos são formatados com '%' apenas se a mensagem for registrada.
+        """
+        if self._logger.isEnabledFor(level):
+            self._emit(level, message, args, indent)
+
+    def _emit(self, level: int, message: str, args: tuple, indent: int | None = None) -> None:
+        """Registra a mensagem já indentada. O nível deve ter sido verificado por quem chama."""
+        if indent is not None:
+            prefix = " " * self._current_indent_level * indent
+        else:
+            # O prefixo de cada nível de indentação é montado uma única vez
+            depth = self._current_indent_level
+            prefix = self._indent_cache.get(depth)
+            if prefix is None:
+                prefix = self._indent_cache[depth] = " " * depth * self._indent
+        self._logger.log(level, prefix + message, *args)
 
     def _create_logger(self, log_level: int | None = None, file_path: str | None = None) -> logging.Logger:
         
         # Criação do logger
         log_level = log_level if log_level is not None else Config.LOG_LEVEL
-        logger = logging.getLogger(__name__)
-        logger.setLevel(log_level)
-
-        # Formatação padrão
-        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-
-        # Handler para arquivo
-        if file_path is None:
-            file_path = os.path.join(Config.LOG_DIR, f'{datetime.now().strftime("%d-%m-%Y_%H-%M")}.log')
-
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        file_handler = logging.FileHandler(file_path, mode='w', encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-
-        # Handler para console (terminal)
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(log_level)
-        console_handler.setFormatter(formatter)
-
-        # Adicionando os handlers ao logger
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        default_path = os.path.abspath(Config.log_file_path())
+        file_path = os.path.abspath(file_path) if file_path is not None else default_path
+
+        # Cada arquivo de log tem o seu próprio logger; o arquivo padrão usa o logger do módulo
+        name = __name__ if file_path == default_path else f'{__name__}.{file_path}'
+        logger = logging.getLogger(name)
+
+        with _logger_lock:
+
+            # O logger é compartilhado entre os drivers do mesmo arquivo: é configurado apenas na primeira vez
+            if logger.handlers:
+                if logger.level != log_level:
+                    logger.warning(
+                        "Logger de '%s' já configurado com o nível %s; o nível %s foi ignorado",
+                        file_path, logging.getLevelName(logger.level), logging.getLevelName(log_level)
+                    )
+                return logger
+
+            logger.setLevel(log_level)
+
+            # Evita que o logger raiz registre cada mensagem novamente
+            logger.propagate = False
+
+            # Handler para arquivo
+            log_dir = os.path.dirname(file_path)
+            if log_dir not in _created_dirs:
+                os.makedirs(log_dir, exist_ok=True)
+                _created_dirs.add(log_dir)
+            file_handler = logging.FileHandler(file_path, mode='w', encoding='utf-8')
+            file_handler.setLevel(logging.DEBUG)
+            file_handler.setFormatter(self._FORMATTER)
+
+            # O arquivo é escrito em lotes; erros são gravados imediatamente, junto com o que estava no buffer.
+            # O logging.shutdown, executado ao fim do processo, esvazia o buffer antes de fechar o arquivo
+            buffered_handler = _FrozenMemoryHandler(
+                _LOG_BUFFER_CAPACITY,
+                flushLevel=logging.ERROR,
+                target=file_handler,
+                flushOnClose=True
+            )
+            buffered_handler.setLevel(logging.DEBUG)
+
+            # Handler para console (terminal)
+            console_handler = logging.StreamHandler()
+            console_handler.setLevel(log_level)
+            console_handler.setFormatter(self._FORMATTER)
+
+            # Adicionando os handlers ao logger
+            logger.addHandler(buffered_handler)
+            logger.addHandler(console_handler)
 
         return logger
@@ -0,0 +1,172 @@
+import threading
+import time
+from typing import Callable, Self
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class BrowserPool:
+
+    MAX_USES_PER_INSTANCE = 50
+
+    def __init__(
+        self,
+        factory: Callable[[], WebDriver],
+        size: int = 2,
+        max_uses: int | None = None,
+        prewarm: bool = True
+    ) -> None:
+        """
+        Pool de instâncias WebDriver pré-aquecidas, reaproveitadas entre execuções.
+
+        Args:
+            factory: Função que cria uma nova instância de WebDriver.
+            size: Quantidade máxima de instâncias mantidas pelo pool.
+            max_uses: Quantidade de usos antes de reciclar uma instância. Padrão: MAX_USES_PER_INSTANCE.
+            prewarm: Se deve criar todas as instâncias imediatamente.
+        """
+
+        self._factory = factory
+        self._size = size
+        self._max_uses = max_uses if max_uses is not None else self.MAX_USES_PER_INSTANCE
+        self._idle: list[WebDriver] = []
+        self._uses: dict[WebDriver, int] = {}
+        self._created = 0
+        self._closed = False
+        # Protege '_idle', '_uses', '_created' e '_closed' e acorda quem aguarda uma instância devolvida ou uma vaga liberada
+        self._available = threading.Condition()
+
+        if prewarm:
+            self.warm()
+
+    def warm(self) -> None:
+        """Cria instâncias até completar o tamanho do pool."""
+        while True:
+            driver = self._spawn()
+            if driver is None:
+                return
+            self._put_idle(driver)
+
+    def acquire(self, timeout: float | None = None) -> WebDriver:
+        """
+        Retira uma instância do pool. Caso nenhuma esteja livre e o pool ainda
+        não esteja cheio, cria uma nova; do contrário, aguarda uma devolução.
+
+        Levanta RuntimeError se o pool já tiver sido encerrado.
+
+        Args:
+            timeout: Tempo máximo para aguardar uma instância livre.
+        """
+
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        with self._available:
+            while True:
+                if self._closed:
+                    raise RuntimeError("O pool de drivers já foi encerrado")
+
+                if self._idle:
+                    return self._idle.pop()
+
+                # Vaga livre, inclusive uma liberada por '_discard': a instância é criada fora do lock
+                if self._created < self._size:
+                    self._created += 1
+                    break
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise TimeoutError(f"Nenhum driver disponível no pool após {timeout} segundos")
+                self._available.wait(remaining)
+
+        return self._create()
+
+    def release(self, driver: WebDriver, healthy: bool = True) -> None:
+        """
+        Devolve uma instância ao pool, limpando cookies e a página atual.
+        Instâncias com falha, que atingiram o limite de usos ou devolvidas após 'close' são encerradas.
+
+        Args:
+            driver: A instância retirada com 'acquire'.
+            healthy: Se a instância terminou a execução sem erros.
+        """
+
+        with self._available:
+            uses = self._uses.get(driver, 0) + 1
+            recycle = self._closed or not healthy or uses >= self._max_uses
+        if recycle:
+            self._discard(driver)
+            return
+
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+        except Exception:
+            self._discard(driver)
+            return
+
+        self._put_idle(driver, uses)
+
+    def close(self) -> None:
+        """
+        Encerra todas as instâncias livres do pool. Instâncias em uso são encerradas ao serem devolvidas,
+        e novas chamadas a 'acquire' levantam RuntimeError.
+        """
+        with self._available:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            # Quem aguardava uma instância deve ver o pool encerrado em vez de aguardar até o timeout
+            self._available.notify_all()
+        for driver in idle:
+            self._discard(driver)
+
+    def _spawn(self) -> WebDriver | None:
+        """Cria uma nova instância se o pool ainda não estiver cheio nem encerrado."""
+
+        with self._available:
+            if self._closed or self._created >= self._size:
+                return None
+            self._created += 1
+        return self._create()
+
+    def _create(self) -> WebDriver:
+        """Cria a instância para uma vaga já reservada, devolvendo a vaga em caso de falha."""
+        try:
+            return self._factory()
+        except Exception:
+            self._free_slot()
+            raise
+
+    def _put_idle(self, driver: WebDriver, uses: int = 0) -> None:
+        """
+        Coloca a instância entre as livres e acorda quem estiver aguardando.
+        Se o pool tiver sido encerrado nesse meio tempo, a instância é encerrada.
+        """
+        with self._available:
+            if not self._closed:
+                self._uses[driver] = uses
+                self._idle.append(driver)
+                self._available.notify()
+                return
+        self._discard(driver)
+
+    def _free_slot(self) -> None:
+        """Libera uma vaga do pool e acorda quem estiver aguardando, para que crie uma nova instância."""
+        with self._available:
+            self._created -= 1
+            self._available.notify()
+
+    def _discard(self, driver: WebDriver) -> None:
+        """Encerra a instância e libera sua vaga para uma nova."""
+
+        with self._available:
+            self._uses.pop(driver, None)
+            self._free_slot()
+
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
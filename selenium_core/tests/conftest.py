@@ -1,7 +1,6 @@
 import pytest
 import os
-from driver import Driver
-from config import Config
+from selenium_core import Driver, Config
 
 
 @pytest.fixture(scope="session")
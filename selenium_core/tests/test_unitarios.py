@@ -1,37 +1,113 @@
+import re
 import pytest
+from collections import namedtuple
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.by import By
 from unittest.mock import MagicMock
-from driver import Driver
+from selenium_core.locator import Locator
+from selenium_core.pool import BrowserPool
+from selenium_core.utils import is_web_element, is_by_tuple, check_locator, locator_kind, WEB_ELEMENT, BY_TUPLE
 
-driver_instance = Driver()
 
+# O spec de WebElement é montado uma única vez e compartilhado entre os casos
+_WEB_ELEMENT = MagicMock(spec=WebElement)
+
+_LOCATOR_ERR_RE = re.compile(r"deve ser do tipo 'WebElement' ou 'tuple'")
+
+_ByTuple = namedtuple('_ByTuple', ['by', 'value'])
 
-def test_is_web_element():
-    """Testa a verificação de tipo para WebElement."""
 
-    mock_element = MagicMock(spec=WebElement)
+class _By(str):
+    """Subclasse de str, como os membros de um StrEnum."""
 
-    assert driver_instance._is_web_element(mock_element) == True
-    assert driver_instance._is_web_element((By.ID, "teste")) == False
-    assert driver_instance._is_web_element("uma string") == False
-    assert driver_instance._is_web_element(None) == False
+
+@pytest.mark.parametrize("value, expected", [
+    pytest.param(_WEB_ELEMENT, True, id="web_element"),
+    pytest.param((By.ID, "teste"), False, id="tupla"),
+    pytest.param("uma string", False, id="string"),
+    pytest.param(None, False, id="none"),
+])
+def test_is_web_element(value, expected):
+    """Testa a verificação de tipo para WebElement."""
+    assert is_web_element(value) is expected
 
 
-def test_is_by_tuple():
+@pytest.mark.parametrize("value, expected", [
+    pytest.param(("id", "meu-id"), True, id="id"),
+    pytest.param(("css selector", ".classe"), True, id="css"),
+    pytest.param(("id",), False, id="um_elemento"),
+    pytest.param((123, "valor"), False, id="by_nao_string"),
+    pytest.param(_ByTuple("id", "meu-id"), True, id="subclasse_de_tuple"),
+    pytest.param((_By("id"), "meu-id"), True, id="subclasse_de_str"),
+    pytest.param(["id", "meu-id"], False, id="lista"),
+])
+def test_is_by_tuple(value, expected):
     """Testa a verificação de tipo para tuplas de localizador."""
-    
-    assert driver_instance._is_by_tuple(("id", "meu-id")) == True
-    assert driver_instance._is_by_tuple(("css selector", ".classe")) == True
-    assert driver_instance._is_by_tuple(("id",)) == False # Tupla com 1 elemento
-    assert driver_instance._is_by_tuple((123, "valor")) == False # Primeiro item não é string
+    assert is_by_tuple(value) is expected
+
+
+@pytest.mark.parametrize("locator, expected", [
+    pytest.param(_WEB_ELEMENT, WEB_ELEMENT, id="web_element"),
+    pytest.param((By.ID, "meu-id"), BY_TUPLE, id="tupla"),
+    pytest.param(Locator(By.ID, "meu-id"), BY_TUPLE, id="locator"),
+    pytest.param(Locator(_By("id"), "meu-id"), BY_TUPLE, id="locator_subclasse_de_str"),
+])
+def test_locator_kind(locator, expected):
+    """Testa a classificação do locator com uma única chamada."""
+    assert locator_kind(locator) == expected
+
+
+@pytest.mark.parametrize("locator", [
+    pytest.param(_WEB_ELEMENT, id="web_element"),
+    pytest.param((By.ID, "meu-id"), id="tupla"),
+])
+def test_check_locator_com_tipos_validos(locator):
+    """Verifica se check_locator aceita WebElements e tuplas (by, value)."""
+    assert check_locator(locator) is True
 
 
 def test_check_locator_com_tipos_invalidos():
-    """Verifica se _check_locator levanta TypeError para tipos inválidos."""
-    
-    with pytest.raises(TypeError, match="deve ser do tipo 'WebElement' ou 'tuple'"):
-        driver_instance._check_locator("locator_invalido")
-        
+    """Verifica se check_locator levanta TypeError para tipos inválidos."""
+
+    with pytest.raises(TypeError, match=_LOCATOR_ERR_RE):
+        check_locator("locator_invalido")
+
     with pytest.raises(TypeError):
-        driver_instance._check_locator(12345)
+        check_locator(12345)
+
+
+def test_pool_acquire_sem_instancia_livre_levanta_timeout():
+    """Verifica se acquire desiste após o timeout quando todas as instâncias estão em uso."""
+
+    pool = BrowserPool(MagicMock, size=1, prewarm=False)
+    pool.acquire()
+
+    with pytest.raises(TimeoutError):
+        pool.acquire(timeout=0.05)
+
+
+def test_pool_recicla_instancia_apos_max_uses():
+    """Verifica se a instância é encerrada e substituída ao atingir o limite de usos."""
+
+    pool = BrowserPool(MagicMock, size=1, max_uses=2, prewarm=False)
+    driver = pool.acquire()
+    pool.release(driver)
+    assert pool.acquire() is driver
+
+    pool.release(driver)
+    driver.quit.assert_called_once()
+    assert pool.acquire() is not driver
+
+
+def test_pool_release_apos_close_encerra_instancia():
+    """Verifica se uma instância devolvida após close é encerrada, e não volta ao pool."""
+
+    pool = BrowserPool(MagicMock, size=1, prewarm=False)
+    driver = pool.acquire()
+    pool.close()
+
+    pool.release(driver)
+    driver.quit.assert_called_once()
+
+    with pytest.raises(RuntimeError):
+        pool.acquire(timeout=0.05)
@@ -1,24 +1,79 @@
 from selenium.webdriver.remote.webelement import WebElement
 from typing import Any, TypeIs
+from .locator import Locator
+
+
+# Tipos de locator retornados por 'locator_kind'
+WEB_ELEMENT = 0
+BY_TUPLE = 1
+
+_LOCATOR_ERR = "O parâmetro 'locator' deve ser do tipo 'WebElement' ou 'tuple', não %s"
+
+# Atributos exibidos na descrição de um elemento, na ordem em que aparecem
+_DESCRIBED_ATTRIBUTES = ('id', 'class', 'name', 'href', 'data-widget-id')
+
+# Tag, atributos e texto do elemento em uma única chamada ao navegador
+_JS_DESCRIBE = """
+var e = arguments[0], names = arguments[1], attrs = [];
+for (var i = 0; i < names.length; i++) {
+    var v = names[i] === 'href' && typeof e.href === 'string' ? e.href : e.getAttribute(names[i]);
+    if (v) attrs.push([names[i], v]);
+}
+return [e.tagName.toLowerCase(), attrs, e.innerText || ''];
+"""
 
 
 def is_web_element(element: Any) -> TypeIs[WebElement]:
-    return isinstance(element, WebElement)
+    return type(element) is WebElement or isinstance(element, WebElement)
 
 
 def is_by_tuple(element: Any) -> TypeIs[tuple[str, str]]:
-    return isinstance(element, tuple) and len(element) == 2 and isinstance(element[0], str) and isinstance(element[1], str)
+    if type(element) is Locator:
+        return True
 
+    if not isinstance(element, tuple):
+        return False
 
-def check_locator(locator: WebElement | tuple[str, str]) -> bool:
-
-    if is_web_element(locator):
+    try:
+        by, value = element
+    except ValueError:
+        return False
+    if type(by) is str and type(value) is str:
         return True
 
+    # Subclasses de str, como membros de StrEnum, também são aceitas
+    return isinstance(by, str) and isinstance(value, str)
+
+
+def locator_kind(locator: WebElement | tuple[str, str]) -> int:
+    """
+    Classifica o locator com uma única verificação no caso comum.
+    Retorna WEB_ELEMENT ou BY_TUPLE, ou levanta TypeError se o locator for inválido.
+    """
+
+    # Caminho rápido: comparação de tipo exata, sem isinstance
+    kind = type(locator)
+    if kind is WebElement:
+        return WEB_ELEMENT
+    if kind is Locator:
+        return BY_TUPLE
+
+    # Tuplas mal formadas já falham em find_element(*locator); com 'python -O' a validação é omitida
+    if kind is tuple and (not __debug__ or is_by_tuple(locator)):
+        return BY_TUPLE
+
+    # Caminho lento: subclasses de WebElement e validação do conteúdo da tupla
+    if isinstance(locator, WebElement):
+        return WEB_ELEMENT
     if is_by_tuple(locator):
-        return True
+        return BY_TUPLE
     
-    raise TypeError(f"O parâmetro 'locator' deve ser do tipo 'WebElement' ou 'tuple', não {type(locator).__name__}")
+    raise TypeError(_LOCATOR_ERR % type(locator).__name__)
+
+
+def check_locator(locator: WebElement | tuple[str, str]) -> bool:
+    locator_kind(locator)
+    return True
 
 
 def describe_element(element: WebElement) -> str:
@@ -27,15 +82,10 @@ def describe_element(element: WebElement) -> str:
         return str(element)
     
     try:
-        tag = element.tag_name
-        
-        attrs = []
-        for attr in ['id', 'class', 'name', 'href', 'data-widget-id']:
-            value = element.get_attribute(attr)
-            if value:
-                attrs.append(f'{attr}="{value}"')
-        
-        text = element.text.strip().replace('\n', ' ')
+        tag, values, text = element.parent.execute_script(_JS_DESCRIBE, element, _DESCRIBED_ATTRIBUTES)
+        attrs = [f'{attr}="{value}"' for attr, value in values]
+
+        text = text.strip().replace('\n', ' ')
         text_snippet = (text[:40] + '...') if len(text) > 40 else text
         
         attr_str = ' '.join(attrs)
@@ -44,3 +94,22 @@ def describe_element(element: WebElement) -> str:
     except Exception:
         # Fallback caso o elemento se torne "stale" durante a descrição
         return "<WebElement (expirado ou inacessível)>"
+
+
+class LazyDescription:
+    """
+    Descrição de um elemento montada apenas quando convertida em texto. Usada nos logs,
+    para que as consultas ao navegador de 'describe_element' só ocorram se a mensagem for registrada.
+    """
+
+    __slots__ = ('element', '_text')
+
+    def __init__(self, element: WebElement | tuple[str, str]) -> None:
+        self.element = element
+        self._text = None
+
+    def __str__(self) -> str:
+        # Cada handler do logger formata a mensagem: a descrição é montada uma única vez
+        if self._text is None:
+            self._text = describe_element(self.element)
+        return self._text
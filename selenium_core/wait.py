@@ -1,27 +1,103 @@
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.types import WaitExcTypes
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Callable, TypeVar, Self
+import time
 
 
 T = TypeVar('T')
 
+# Maior intervalo entre tentativas alcançado pelo polling adaptativo
+MAX_POLL_FREQUENCY = 0.5
+
+# Quantidade máxima de WebDriverWait guardados por Wait. Timeouts calculados a cada chamada
+# (tempo restante até um prazo) geram chaves sempre novas, e o cache não pode crescer sem limite
+_WAIT_CACHE_MAXSIZE = 32
+
+# Condições do expected_conditions disponíveis como métodos de Wait, resolvidas uma única vez
+_EC_CONDITIONS: dict[str, Callable] = {
+    name: value for name, value in vars(EC).items() if not name.startswith('_') and callable(value)
+}
+
+
+@lru_cache(maxsize=256)
+def _cached_predicate(condition: Callable, locator: tuple[str, str] | str) -> Callable:
+    """Cria o predicado da condição para o locator uma única vez. Os predicados do EC não guardam estado."""
+    return condition(locator)
+
+
+class _BackoffWait(WebDriverWait):
+    """
+    WebDriverWait cujo intervalo entre as tentativas dobra a cada falha, até MAX_POLL_FREQUENCY.
+    Elementos que aparecem logo são encontrados rapidamente, e esperas longas enviam menos comandos ao navegador.
+    """
+
+    def until(self, method: Callable[[WebDriver], T], message: str = "") -> T:
+
+        screen = None
+        stacktrace = None
+        poll = self._poll
+        max_poll = max(self._poll, MAX_POLL_FREQUENCY)
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if value:
+                    return value
+            except self._ignored_exceptions as exc:
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            if time.monotonic() > end_time:
+                break
+            time.sleep(poll)
+            poll = min(poll * 2, max_poll)
+        raise TimeoutException(message, screen, stacktrace)
+
+    def until_not(self, method: Callable[[WebDriver], T], message: str = "") -> T | bool:
+
+        poll = self._poll
+        max_poll = max(self._poll, MAX_POLL_FREQUENCY)
+        end_time = time.monotonic() + self._timeout
+        while True:
+            try:
+                value = method(self._driver)
+                if not value:
+                    return value
+            except self._ignored_exceptions:
+                return True
+            if time.monotonic() > end_time:
+                break
+            time.sleep(poll)
+            poll = min(poll * 2, max_poll)
+        raise TimeoutException(message)
+
+
 class Wait:
 
+    # '__dict__' é mantido para guardar os wrappers das condições criados em __getattr__
+    __slots__ = (
+        '_driver', '_default_timeout', '_default_poll_frequency',
+        '_default_ignored_exceptions', '_negated', '_wait_cache', '__dict__'
+    )
+
     def __init__(
         self,
         driver: WebDriver,
         default_timeout: float = 30,
-        default_poll_frequency: float = 0.5,
+        default_poll_frequency: float = 0.1,
         default_ignored_exceptions: WaitExcTypes | None = None
     ) -> None:
         
         self._driver = driver
         self._default_timeout = default_timeout
         self._default_poll_frequency = default_poll_frequency
-        self._default_ignored_exceptions = default_ignored_exceptions
+        self._default_ignored_exceptions = self._freeze_exceptions(default_ignored_exceptions)
         self._negated = False
+        self._wait_cache: OrderedDict[tuple, WebDriverWait] = OrderedDict()
     
     @property
     def Not(self) -> Self:
@@ -35,18 +111,52 @@ class Wait:
         poll_frequency: float | None = None,
         ignored_exceptions: WaitExcTypes | None = None
     ) -> T:
-        """Aguarda até que a condição especificada seja atendida."""
-        
+        """
+        Aguarda até que a condição especificada seja atendida.
+        Sem 'poll_frequency', o intervalo padrão é o inicial e dobra a cada tentativa, até MAX_POLL_FREQUENCY.
+        """
+
+        adaptive = poll_frequency is None
         timeout, poll_frequency, ignored_exceptions = self._get_wait_params(
             timeout, poll_frequency, ignored_exceptions
         )
         
-        wait = WebDriverWait(self._driver, timeout, poll_frequency, ignored_exceptions)
+        wait = self._get_wait(timeout, poll_frequency, ignored_exceptions, adaptive)
         if self._negated:
             self._negated = False
             return wait.until_not(condition)
         return wait.until(condition)
 
+    def _get_wait(
+        self,
+        timeout: float,
+        poll_frequency: float | None,
+        ignored_exceptions: WaitExcTypes | None,
+        adaptive: bool = False
+    ) -> WebDriverWait:
+        """Retorna um WebDriverWait reutilizável para os parâmetros informados, criando-o na primeira vez."""
+
+        ignored_exceptions = self._freeze_exceptions(ignored_exceptions)
+        key = (timeout, poll_frequency, ignored_exceptions, adaptive)
+        wait = self._wait_cache.get(key)
+        if wait is not None:
+            self._wait_cache.move_to_end(key)
+            return wait
+
+        wait_cls = _BackoffWait if adaptive else WebDriverWait
+        wait = wait_cls(self._driver, timeout, poll_frequency, ignored_exceptions)
+        self._wait_cache[key] = wait
+        if len(self._wait_cache) > _WAIT_CACHE_MAXSIZE:
+            self._wait_cache.popitem(last=False)
+        return wait
+
+    @staticmethod
+    def _freeze_exceptions(ignored_exceptions: WaitExcTypes | None) -> type[Exception] | tuple | None:
+        """Converte as exceções ignoradas em um valor hasheável. Tuplas, classes e None são retornados sem alteração."""
+        if ignored_exceptions is None or type(ignored_exceptions) is tuple or isinstance(ignored_exceptions, type):
+            return ignored_exceptions
+        return tuple(ignored_exceptions)
+
     def _get_timeout(self, timeout: float | None) -> float:
         """Retorna o tempo limite padrão se nenhum for especificado."""
         return timeout if timeout is not None else self._default_timeout
@@ -74,7 +184,7 @@ class Wait:
 
     def __getattr__(self, name: str) -> Callable:
         
-        condition = getattr(EC, name, None)
+        condition = _EC_CONDITIONS.get(name)
         if condition is None:
             raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
 
@@ -85,13 +195,20 @@ class Wait:
             if 'locator' in kwargs:
                 locator = kwargs.pop('locator')
             else:
-                locator, *args = args[:]
+                locator = args[0]
+                args = args[1:]
             
             timeout = kwargs.pop('timeout', None)
             poll_frequency = kwargs.pop('poll_frequency', None)
             ignored_exceptions = kwargs.pop('ignored_exceptions', None)
 
-            predicate = condition(locator, *args, **kwargs)
+            # Locators hasheáveis sem argumentos extras reaproveitam o predicado já criado
+            if not args and not kwargs and isinstance(locator, (tuple, str)):
+                predicate = _cached_predicate(condition, locator)
+            else:
+                predicate = condition(locator, *args, **kwargs)
             return self.until(predicate, timeout, poll_frequency, ignored_exceptions)
 
+        # Guarda o wrapper na instância: os próximos acessos não passam mais pelo __getattr__
+        self.__dict__[name] = wait_wrapper
         return wait_wrapper
@@ -7,6 +7,8 @@ from typing import Self, Callable, TypeVar
 
 T = TypeVar('T')
 
+MAX_POLL_FREQUENCY: float
+
 
 class Wait:
 
@@ -14,7 +16,7 @@ class Wait:
         self,
         driver: WebDriver,
         default_timeout: float = 30,
-        default_poll_frequency: float = 0.5,
+        default_poll_frequency: float = 0.1,
         default_ignored_exceptions: WaitExcTypes | None = None
     ) -> None: ...
 